@@ -1,30 +1,64 @@
 """FastAPI backend for EventFinder application."""
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.routing import APIRouter
+from fastapi.sse import EventSourceResponse, ServerSentEvent
+
+from backend.models import ChatRequest, ChatResponse
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.routing import APIRouter
 
-from backend.models import ChatRequest, ChatResponse
-from backend.services.chat import process_chat_message
-from backend.services.plugin_loader import get_plugin_info, load_all_plugins
+# Allowed CORS origins (Vite dev server)
+CORS_ORIGINS = ["http://localhost:5173"]
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown events."""
-    # Startup: Load plugins
-    load_all_plugins()
+    # Services pull in crawl4ai/Playwright and the LLM SDKs, so they are
+    # imported here rather than at module import time
+    from backend.services.ai import close_anthropic_client, get_anthropic_client
+    from backend.services.chat import prefetch_popular_queries, refresh_plugin_instances
+    from backend.services.crawler import close_crawler, start_crawler
+    from backend.services.http_client import close_http_client, start_http_client
+    from backend.services.mcp_client import close_mcp_client
+    from backend.services.plugin_loader import load_all_plugins
+
+    # Startup: Create the Anthropic client now so a missing API key stops
+    # the server at boot instead of failing the first chat request
+    get_anthropic_client()
+
+    # Load plugins in a worker thread while the shared clients start
+    await asyncio.gather(
+        asyncio.to_thread(load_all_plugins),
+        start_crawler(),
+        start_http_client(),
+    )
+    refresh_plugin_instances()
+    # Keep popular queries warm in the background
+    prefetch_task = asyncio.create_task(prefetch_popular_queries())
     yield
-    # Shutdown: (nothing to clean up)
+    # Shutdown: Stop prefetching, then close the shared browser, HTTP and MCP connections
+    prefetch_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await prefetch_task
+    await asyncio.gather(
+        close_crawler(),
+        close_http_client(),
+        close_anthropic_client(),
+        close_mcp_client(),
+    )
 
 
 # Create the main FastAPI app
@@ -38,7 +72,7 @@ app = FastAPI(
 # Configure CORS for Vite dev server
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:5173"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -55,34 +89,84 @@ async def health_check() -> dict[str, str]:
 
 
 @api_router.get("/plugins")
-async def list_plugins() -> list[dict[str, str]]:
+async def list_plugins() -> Response:
     """List all loaded scraper plugins.
 
+    The JSON body is encoded once when plugins load, so this skips
+    per-request serialization.
+
     Returns:
         List of plugin information (name, source_url, description).
     """
-    return get_plugin_info()
+    from backend.services.plugin_loader import get_plugin_info_json
 
+    return Response(content=get_plugin_info_json(), media_type="application/json")
 
-@api_router.post("/chat")
-async def chat(request: ChatRequest) -> ChatResponse:
+
+@api_router.post("/chat", responses={200: {"model": ChatResponse}})
+async def chat(request: ChatRequest) -> Response:
     """Chat with the AI assistant.
 
+    The result is already in response format, so it is encoded with orjson
+    directly instead of being re-validated into a ChatResponse. The schema
+    is only documented for OpenAPI; event dicts come from Event.response_data,
+    built from validated Event fields in EventResponse's shape.
+
     Args:
         request: Chat request with message and optional conversation_id.
 
     Returns:
         Chat response with AI response and conversation_id.
     """
+    from backend.services.chat import process_chat_message
+
     result = await process_chat_message(
         message=request.message,
         conversation_id=request.conversation_id,
     )
-    return ChatResponse(
-        response=result["response"],
-        conversation_id=result["conversation_id"],
-        events=result.get("events", []),
-    )
+    return Response(content=orjson.dumps(result), media_type="application/json")
+
+
+@api_router.post("/chat/stream", response_class=EventSourceResponse)
+async def chat_stream(request: ChatRequest) -> AsyncIterator[ServerSentEvent]:
+    """Chat with the AI assistant, streaming the response as it is generated.
+
+    Sends a "conversation" message with the conversation_id, "text" messages
+    with response chunks, a "tool_use" message with the tool names whenever
+    the text so far was a preamble to tool calls, and a final "events"
+    message.
+
+    Args:
+        request: Chat request with message and optional conversation_id.
+    """
+    from backend.services.chat import stream_chat_message
+
+    async for kind, value in stream_chat_message(
+        message=request.message,
+        conversation_id=request.conversation_id,
+    ):
+        yield ServerSentEvent(event=kind, data=value)
+
+
+@api_router.get("/events/stream", response_class=EventSourceResponse)
+async def stream_events(query: str | None = None) -> AsyncIterator[ServerSentEvent]:
+    """Stream scraped events as each plugin finishes.
+
+    Sends one "events" message per plugin, so results from fast sources
+    reach the client without waiting for the slowest scraper, followed by
+    a final "done" message.
+
+    Args:
+        query: Optional search query for plugins that support searching.
+    """
+    from backend.services.chat import iter_plugin_events
+
+    async for plugin_name, events in iter_plugin_events(query):
+        yield ServerSentEvent(
+            event="events",
+            data={"plugin": plugin_name, "events": events},
+        )
+    yield ServerSentEvent(event="done", data=None)
 
 
 # Include the API router
@@ -1,13 +1,39 @@
 """Pydantic models for EventFinder application."""
 
+import hashlib
 from datetime import datetime
+from functools import cached_property
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Day names indexed by datetime.weekday()
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+def make_event_id(source: str, url: str, date: datetime) -> str:
+    """Build a stable event ID from the event's source, URL and date.
+
+    The same scraped event always gets the same ID, so results can be
+    deduplicated and cached across scrapes.
+
+    Args:
+        source: Name of the plugin that produced the event.
+        url: Event URL.
+        date: Event date.
+
+    Returns:
+        A 16-character hex digest.
+    """
+    key = f"{source}|{url}|{date.isoformat()}"
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
 
 
 class Event(BaseModel):
     """Standard event model for all scraper plugins."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     description: str | None = None
@@ -18,10 +44,50 @@ class Event(BaseModel):
     source: str
     tags: list[str] = Field(default_factory=list)
 
+    @cached_property
+    def tool_data(self) -> dict[str, Any]:
+        """Event fields as sent to the AI in tool results.
+
+        Events are immutable and reused across scrapes through the scrape
+        cache, so this is built once per event.
+        """
+        # Include both date and day name so the AI doesn't have to guess
+        return {
+            "id": self.id,  # Include ID so Claude can select events
+            "title": self.title,
+            "url": self.url,
+            "date": self.date.date().isoformat(),
+            "day": DAY_NAMES[self.date.weekday()],  # e.g., "Monday"
+            "time": self.time,
+            "location": self.location,
+            "description": self.description,
+            "source": self.source,
+        }
+
+    @cached_property
+    def response_data(self) -> dict[str, Any]:
+        """Event fields in API response format (see EventResponse).
+
+        Built once per event, like tool_data. Callers must not modify it.
+        """
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "date": self.date.isoformat(),
+            "time": self.time,
+            "location": self.location,
+            "url": self.url,
+            "source": self.source,
+            "tags": self.tags,
+        }
+
 
 class ChatRequest(BaseModel):
     """Request model for chat endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     message: str
     conversation_id: str | None = None
 
@@ -29,6 +95,8 @@ class ChatRequest(BaseModel):
 class EventResponse(BaseModel):
     """Event data model for API responses."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     description: str | None = None
@@ -43,6 +111,8 @@ class EventResponse(BaseModel):
 class ChatResponse(BaseModel):
     """Response model for chat endpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     response: str
     conversation_id: str
     events: list[EventResponse] = Field(default_factory=list)
@@ -1,20 +1,34 @@
 """Base class for scraper plugins."""
 
 from abc import ABC, abstractmethod
+from typing import Any
 from urllib.parse import quote_plus
 
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig
+from crawl4ai import CrawlerRunConfig
 
 from backend.models import Event
+from backend.services.crawler import crawl_markdown
+from backend.services.http_client import get_http_client
 
-# Default scroll script for infinite scroll pages
-DEFAULT_SCROLL_SCRIPT = """
-async function scrollToBottom() {
-    for (let i = 0; i < 5; i++) {
-        window.scrollTo(0, document.body.scrollHeight);
-        await new Promise(r => setTimeout(r, 1000));
-    }
-}
+# Scroll script for infinite scroll pages. Each iteration scrolls to the
+# bottom and polls (every 100ms, up to 1s) for the page to grow; scrolling
+# stops as soon as no new content loads.
+SCROLL_SCRIPT_TEMPLATE = """
+async function scrollToBottom() {{
+    for (let i = 0; i < {scroll_count}; i++) {{
+        const lastHeight = document.body.scrollHeight;
+        window.scrollTo(0, lastHeight);
+        let grew = false;
+        for (let t = 0; t < 10; t++) {{
+            await new Promise(r => setTimeout(r, 100));
+            if (document.body.scrollHeight > lastHeight) {{
+                grew = true;
+                break;
+            }}
+        }}
+        if (!grew) break;
+    }}
+}}
 await scrollToBottom();
 """
 
@@ -33,12 +47,19 @@ class ScraperPlugin(ABC):
     # Whether this plugin supports search queries
     supports_search: bool = False
 
+    # Whether scrape results may be cached and reused. Set to False for
+    # plugins whose events depend on the time of the scrape.
+    cacheable: bool = True
+
     # Whether to scroll the page to load more content (for infinite scroll sites)
     scroll_for_more: bool = False
 
-    # Number of scroll iterations (each ~1 second)
+    # Maximum number of scroll iterations (each up to ~1 second)
     scroll_count: int = 5
 
+    # Optional: wait condition before scraping, e.g. "css:.event-card"
+    wait_for: str | None = None
+
     # Custom JavaScript to run before scraping (optional)
     custom_js: str | None = None
 
@@ -70,27 +91,13 @@ class ScraperPlugin(ABC):
 
     def _get_scroll_script(self) -> str:
         """Get the scroll script with configured scroll count."""
-        return f"""
-async function scrollToBottom() {{
-    for (let i = 0; i < {self.scroll_count}; i++) {{
-        window.scrollTo(0, document.body.scrollHeight);
-        await new Promise(r => setTimeout(r, 1000));
-    }}
-}}
-await scrollToBottom();
-"""
+        return SCROLL_SCRIPT_TEMPLATE.format(scroll_count=self.scroll_count)
 
-    async def crawl(self, url: str) -> str:
-        """Crawl a URL and return the markdown content.
-
-        Waits for JavaScript content to load using networkidle.
-        Optionally scrolls to load more content for infinite scroll sites.
-
-        Args:
-            url: The URL to crawl.
+    def _get_run_config(self) -> CrawlerRunConfig:
+        """Build the crawler run config from the plugin settings.
 
         Returns:
-            Markdown representation of the page content.
+            Run configuration for a crawl of this plugin's pages.
         """
         # Build JS code: scroll script + custom JS if needed
         js_code = None
@@ -99,11 +106,44 @@ await scrollToBottom();
         if self.custom_js:
             js_code = (js_code or "") + "\n" + self.custom_js
 
-        config = CrawlerRunConfig(
+        return CrawlerRunConfig(
             wait_until="networkidle",
+            wait_for=self.wait_for,
             page_timeout=60000 if self.scroll_for_more else 30000,
             js_code=js_code,
         )
-        async with AsyncWebCrawler() as crawler:
-            result = await crawler.arun(url=url, config=config)
-            return result.markdown
+
+    async def crawl(self, url: str) -> str:
+        """Crawl a URL and return the markdown content.
+
+        Waits for JavaScript content to load using networkidle.
+        Optionally scrolls to load more content for infinite scroll sites.
+        Uses the application-wide shared crawler, so no browser is launched
+        per call.
+
+        Args:
+            url: The URL to crawl.
+
+        Returns:
+            Markdown representation of the page content.
+        """
+        return await crawl_markdown(url, self._get_run_config())
+
+    async def fetch_json(self, url: str, **params: Any) -> Any:
+        """Fetch a JSON document directly, without rendering a page.
+
+        Prefer this over crawl() when a site exposes a JSON API. Uses the
+        application-wide HTTP client, so connections are reused across
+        scrapes.
+
+        Args:
+            url: The URL to fetch.
+            **params: Query string parameters.
+
+        Returns:
+            The decoded JSON body.
+        """
+        client = await get_http_client()
+        response = await client.get(url, params=params or None)
+        response.raise_for_status()
+        return response.json()
@@ -1,15 +1,43 @@
 """CerebralvalleyAi event scraper plugin."""
 
+import asyncio
 import logging
 import re
-import uuid
 from datetime import datetime
 
-from backend.models import Event
+from backend.models import Event, make_event_id
 from backend.plugins.base import ScraperPlugin
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used by the markdown parser
+# Single document scan: either a date header line like "Jan30", or an event
+# title link "### [Title](url)" with a lookahead window of the next 7 lines
+EVENT_SCAN_RE = re.compile(
+    r'^[^\S\n]*(?P<month>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)(?P<day>\d{1,2})[^\S\n]*$'
+    r'|###[^\S\n]*\[(?P<title>[^\]\n]+)\]\((?P<url>[^)\n]+)\)[^\n]*(?=(?P<tail>(?:\n[^\n]*){0,7}))',
+    re.IGNORECASE | re.MULTILINE,
+)
+TITLE_START_RE = re.compile(r'###\s*\[')
+TIME_RE = re.compile(r'([A-Za-z]{3}\s*·\s*)?(\d{1,2}:\d{2}\s*(?:AM|PM)(?:\s*[–-]\s*\d{1,2}:\d{2}\s*(?:AM|PM))?(?:\s+[A-Z]{2,4})?)', re.IGNORECASE)
+DATE_CLEAN_RE = re.compile(r'[^a-zA-Z0-9\s]')
+MONTH_DAY_RE = re.compile(
+    r'(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?'
+    r'|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+(\d{1,2})',
+    re.IGNORECASE,
+)
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+DAY_PREFIX_RE = re.compile(r'^[A-Za-z]{3}\s*·\s*')
+
+# Substrings that mark non-event lines
+SKIP_TITLES = ('sign in', 'search', 'submit', 'all events', 'events')
+LOCATION_HINTS = ('Ave', 'St', 'Dr', 'CA', 'SF', 'San Francisco', 'Palo Alto', 'Menlo Park')
+LOCATION_SKIPS = ('http', 'see more', '@', 'utm_')
+DESCRIPTION_SKIPS = ('http', 'utm_')
+
 
 class CerebralvalleyAiPlugin(ScraperPlugin):
     """Scraper plugin for cerebralvalley.ai events."""
@@ -26,7 +54,8 @@ class CerebralvalleyAiPlugin(ScraperPlugin):
         try:
             url = self.get_scrape_url(query)
             markdown = await self.crawl(url)
-            return self._parse_events(markdown)
+            # Parse in a worker thread so the event loop keeps serving requests
+            return await asyncio.to_thread(self._parse_events, markdown)
         except Exception as e:
             logger.error(f"Error scraping events: {e}")
             return []
@@ -34,107 +63,92 @@ class CerebralvalleyAiPlugin(ScraperPlugin):
     def _parse_events(self, markdown: str) -> list[Event]:
         """Parse events from markdown based on cerebralvalley.ai structure."""
         events: list[Event] = []
-        lines = markdown.split('\n')
-
-        i = 0
         current_date = None
-        
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # Look for date headers like "Jan30", "Jan27", etc.
-            date_header_match = re.match(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)(\d{1,2})$', line, re.IGNORECASE)
-            if date_header_match:
-                month = date_header_match.group(1)
-                day = date_header_match.group(2)
-                current_date = f"{month} {day}"
-                i += 1
-                continue
+        # Reference time for year rollover and undated events, taken once per page
+        now = datetime.now()
 
-            # Look for section headers like "## Today", "## Tomorrow"
-            if re.match(r'^##\s+(Today|Tomorrow)', line):
-                i += 1
+        for match in EVENT_SCAN_RE.finditer(markdown):
+            # Date headers like "Jan30", "Jan27", etc.
+            if match['month']:
+                current_date = f"{match['month']} {match['day']}"
                 continue
 
-            # Match event title links: ### [Title](url)
-            title_match = re.search(r'###\s*\[([^\]]+)\]\(([^)]+)\)', line)
-            if title_match:
-                title = title_match.group(1).strip()
-                url = title_match.group(2).strip()
+            title = match['title'].strip()
+            url = match['url'].strip()
+
+            # Skip navigation/filter links
+            if any(skip in title.lower() for skip in SKIP_TITLES):
+                continue
 
-                # Skip navigation/filter links
-                if any(skip in title.lower() for skip in ['sign in', 'search', 'submit', 'all events', 'events']):
-                    i += 1
+            # Make URL absolute if needed
+            if not url.startswith('http'):
+                if url.startswith('/'):
+                    url = f"https://cerebralvalley.ai{url}"
+                else:
+                    url = f"https://cerebralvalley.ai/{url}"
+
+            # Look ahead for time, location, description in the next few lines
+            time_str = None
+            location = None
+            description = None
+
+            for next_line in match['tail'].split('\n')[1:]:
+                next_line = next_line.strip()
+                if not next_line:
                     continue
 
-                # Make URL absolute if needed
-                if not url.startswith('http'):
-                    if url.startswith('/'):
-                        url = f"https://cerebralvalley.ai{url}"
-                    else:
-                        url = f"https://cerebralvalley.ai/{url}"
-
-                # Look ahead for time, location, description in next few lines
-                time_str = None
-                location = None
-                description = None
-
-                for j in range(i + 1, min(i + 8, len(lines))):
-                    if j >= len(lines):
-                        break
-                    next_line = lines[j].strip()
-                    if not next_line:
-                        continue
-
-                    # Stop if we hit another event title
-                    if re.search(r'###\s*\[', next_line):
-                        break
-
-                    # Check for time pattern: "Fri · 5:00 PM – 9:00 PM PST"
-                    time_match = re.search(r'([A-Za-z]{3}\s*·\s*)?(\d{1,2}:\d{2}\s*(?:AM|PM)(?:\s*[–-]\s*\d{1,2}:\d{2}\s*(?:AM|PM))?(?:\s+[A-Z]{2,4})?)', next_line, re.IGNORECASE)
-                    if time_match and not time_str:
-                        time_str = time_match.group(2) if time_match.group(2) else time_match.group(0)
+                # Stop if we hit another event title
+                if '###' in next_line and TITLE_START_RE.search(next_line):
+                    break
 
-                    # Location often appears after time and contains comma or address
-                    if (',' in next_line or any(addr in next_line for addr in ['Ave', 'St', 'Dr', 'CA', 'SF', 'San Francisco', 'Palo Alto', 'Menlo Park'])) and not location:
-                        if not any(skip in next_line.lower() for skip in ['http', 'see more', '@', 'utm_']) and len(next_line) < 150:
-                            location = next_line
+                # Check for time pattern: "Fri · 5:00 PM – 9:00 PM PST"
+                # (cheap ':' check first; every time contains one)
+                if not time_str and ':' in next_line:
+                    time_match = TIME_RE.search(next_line)
+                    if time_match:
+                        time_str = time_match.group(2) if time_match.group(2) else time_match.group(0)
 
-                    # Description is usually longer text (but not "see more" lines)
-                    if len(next_line) > 100 and 'see more' not in next_line.lower() and not description:
-                        if not any(skip in next_line.lower() for skip in ['http', 'utm_']):
-                            description = next_line[:300]
+                # Location often appears after time and contains comma or address
+                if (',' in next_line or any(addr in next_line for addr in LOCATION_HINTS)) and not location:
+                    if not any(skip in next_line.lower() for skip in LOCATION_SKIPS) and len(next_line) < 150:
+                        location = next_line
 
-                event = self._create_event(title, url, current_date, time_str, location, description)
-                events.append(event)
+                # Description is usually longer text (but not "see more" lines)
+                if len(next_line) > 100 and 'see more' not in next_line.lower() and not description:
+                    if not any(skip in next_line.lower() for skip in DESCRIPTION_SKIPS):
+                        description = next_line[:300]
 
-            i += 1
+            event = self._create_event(title, url, current_date, time_str, location, description, now=now)
+            events.append(event)
 
         return events
 
     def _create_event(self, title: str, url: str, date_str: str | None = None,
                       time_str: str | None = None, location: str | None = None,
-                      description: str | None = None) -> Event:
-        event_date = datetime.now()
+                      description: str | None = None, now: datetime | None = None) -> Event:
+        if now is None:
+            now = datetime.now()
+        event_date = now
         if date_str:
-            # Clean date string and parse
-            date_clean = re.sub(r'[^a-zA-Z0-9\s]', ' ', date_str).strip()
-            for fmt in ["%b %d", "%B %d"]:
+            # Clean date string and parse "Jan 30" / "January 30"
+            date_clean = DATE_CLEAN_RE.sub(' ', date_str).strip()
+            date_match = MONTH_DAY_RE.fullmatch(date_clean)
+            if date_match:
+                month = MONTHS[date_match.group(1)[:3].lower()]
+                day = int(date_match.group(2))
                 try:
-                    parsed = datetime.strptime(date_clean, fmt)
-                    parsed = parsed.replace(year=datetime.now().year)
+                    parsed = datetime(now.year, month, day)
                     # If parsed date is in the past, assume next year
-                    if parsed.date() < datetime.now().date():
-                        parsed = parsed.replace(year=datetime.now().year + 1)
+                    if parsed.date() < now.date():
+                        parsed = parsed.replace(year=now.year + 1)
                     event_date = parsed
-                    break
                 except ValueError:
-                    continue
+                    pass
 
         # Clean up time string if present
         if time_str:
             # Remove day prefix like "Fri · " 
-            time_str = re.sub(r'^[A-Za-z]{3}\s*·\s*', '', time_str).strip()
+            time_str = DAY_PREFIX_RE.sub('', time_str).strip()
 
         # Clean up location
         if location:
@@ -142,7 +156,7 @@ class CerebralvalleyAiPlugin(ScraperPlugin):
             location = location.rstrip(', ').strip()
 
         return Event(
-            id=str(uuid.uuid4()),
+            id=make_event_id(self.name, url, event_date),
             title=title,
             description=description,
             date=event_date,
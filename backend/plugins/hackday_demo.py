@@ -1,10 +1,9 @@
 """Demo plugin for Claude Code Hack Day at Amazon."""
 
-import uuid
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
-from backend.models import Event
+from backend.models import Event, make_event_id
 from backend.plugins.base import ScraperPlugin
 
 # San Francisco timezone
@@ -34,6 +33,10 @@ class HackDayDemoPlugin(ScraperPlugin):
     source_url = "https://luma.com/amazon-hack-day-1-26-2026"
     description = "Demo event for Claude Code Hack Day at Amazon"
 
+    # The event always starts 30 seconds after the scrape, so a cached
+    # result would be in the past
+    cacheable = False
+
     async def scrape(self, query: str | None = None) -> list[Event]:
         """Return the demo event with start time 30 seconds from now."""
         # Get current time in San Francisco
@@ -44,13 +47,14 @@ class HackDayDemoPlugin(ScraperPlugin):
 
         # Format time string
         time_str = event_start.strftime("%-I:%M %p %Z")
+        event_date = event_start.replace(tzinfo=None)  # Store as naive datetime
 
         return [
             Event(
-                id=str(uuid.uuid4()),
+                id=make_event_id(self.name, self.source_url, event_date),
                 title="Claude Code Hack Day at Amazon with Jam.dev",
                 description=EVENT_DESCRIPTION,
-                date=event_start.replace(tzinfo=None),  # Store as naive datetime
+                date=event_date,
                 time=time_str,
                 location="Amazon, San Francisco",
                 url=self.source_url,
@@ -1,15 +1,57 @@
 """Luma event scraper plugin."""
 
+import asyncio
 import logging
 import re
-import uuid
 from datetime import datetime, timedelta
 
-from backend.models import Event
+from backend.models import Event, make_event_id
 from backend.plugins.base import ScraperPlugin
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used by the markdown parser
+DATE_RE = re.compile(
+    r"^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})$",
+    re.IGNORECASE,
+)
+# Free-form event dates: "Jan 28", "January 28", "Jan 28, 2026"
+EVENT_DATE_RE = re.compile(
+    r"^(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?"
+    r"|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+(\d{1,2})(?:,\s+(\d{4}))?$",
+    re.IGNORECASE,
+)
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# Tokenizes the page in one pass: date section headers on their own line
+# and empty event links like [ ](https://luma.com/eventid)
+MARKER_RE = re.compile(
+    r"^[^\S\n]*(?P<date>Today|Tomorrow"
+    r"|(?i:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[^\S\n]+\d{1,2}))[^\S\n]*$"
+    r"|\[[^\S\n]*\]\((?P<url>https://luma\.com/[a-zA-Z0-9_-]+)\)",
+    re.MULTILINE,
+)
+
+# The (up to) 14 lines following an event link
+LOOKAHEAD_RE = re.compile(r"(?:\n[^\n]*){0,14}")
+
+# Classifies a look-ahead line in one match; dispatch on match.lastgroup
+LINE_RE = re.compile(
+    r"(?P<title>###\s+(?P<title_text>.+)$)"
+    r"|(?P<time>(?i:\d{1,2}:\d{2}\s*(?:AM|PM)(?:\s+[A-Z]{3})?)$)"
+    r"|(?P<author>By )"
+    r"|(?P<attendee>\+\d+$)"
+)
+
+# First characters LINE_RE can match; other lines skip the regex entirely
+LINE_RE_FIRST_CHARS = frozenset("#0123456789B+")
+
+# Status badges shown on event cards
+STATUS_BADGES = frozenset({"Waitlist", "Going", "Interested", "Sold Out"})
+
 
 class LumaPlugin(ScraperPlugin):
     """Scraper plugin for lu.ma events."""
@@ -34,23 +76,28 @@ class LumaPlugin(ScraperPlugin):
         """
         try:
             markdown = await self.crawl(self.source_url)
-            return self._parse_events(markdown)
+            # Parse in a worker thread so the event loop keeps serving requests
+            return await asyncio.to_thread(self._parse_events, markdown)
         except Exception as e:
             logger.error(f"Error scraping Luma events: {e}")
             return []
 
-    def _parse_date_header(self, line: str, next_line: str | None) -> datetime | None:
+    def _parse_date_header(
+        self, line: str, next_line: str | None, now: datetime | None = None
+    ) -> datetime | None:
         """Parse a date from section headers like 'Today', 'Tomorrow', or 'Jan 28'.
 
         Args:
-            line: Current line that might be a date header.
+            line: Current line (already trimmed) that might be a date header.
             next_line: Next line (might contain day of week).
+            now: Reference time for the parse (defaults to the current time).
 
         Returns:
             Parsed datetime or None if not a date header.
         """
-        line = line.strip()
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        if now is None:
+            now = datetime.now()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
         # Check for "Today" or "Tomorrow"
         if line == "Today":
@@ -59,18 +106,13 @@ class LumaPlugin(ScraperPlugin):
             return today + timedelta(days=1)
 
         # Check for month-day format like "Jan 28", "Feb 5"
-        month_day_match = re.match(
-            r"^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})$",
-            line,
-            re.IGNORECASE,
-        )
+        month_day_match = DATE_RE.match(line)
         if month_day_match:
-            month_str = month_day_match.group(1)
+            month = MONTHS[month_day_match.group(1).lower()]
             day = int(month_day_match.group(2))
             try:
                 # Parse with current year
-                parsed = datetime.strptime(f"{month_str} {day}", "%b %d")
-                parsed = parsed.replace(year=today.year)
+                parsed = datetime(today.year, month, day)
                 # If date is in the past, assume next year
                 if parsed < today:
                     parsed = parsed.replace(year=today.year + 1)
@@ -90,140 +132,144 @@ class LumaPlugin(ScraperPlugin):
             List of Event objects parsed from content.
         """
         events: list[Event] = []
-        lines = markdown.split("\n")
-
-        current_event: dict[str, str | datetime | None] = {}
         current_date: datetime | None = None
-        i = 0
-
-        while i < len(lines):
-            line = lines[i].strip()
-            next_line = lines[i + 1].strip() if i + 1 < len(lines) else None
+        # Reference time for relative headers and undated events, taken once per page
+        now = datetime.now()
+        last_line_start = -1
+
+        for marker in MARKER_RE.finditer(markdown):
+            # Date section headers apply to the events that follow them
+            if marker.lastgroup == "date":
+                parsed_date = self._parse_date_header(marker.group("date"), None, now)
+                if parsed_date:
+                    current_date = parsed_date
+                continue
 
-            # Check for date section headers
-            parsed_date = self._parse_date_header(line, next_line)
-            if parsed_date:
-                current_date = parsed_date
-                i += 1
+            # Empty event links mark the start of a new event, but only the
+            # first link on a line counts
+            line_start = markdown.rfind("\n", 0, marker.start()) + 1
+            if line_start == last_line_start:
                 continue
+            last_line_start = line_start
+            line_end = markdown.find("\n", marker.end())
+            if line_end == -1:
+                line_end = len(markdown)
+
+            # Start new event with current section date
+            title: str | None = None
+            time_str: str | None = None
+            location: str | None = None
+
+            # Look ahead for title, time, location
+            lookahead = LOOKAHEAD_RE.match(markdown, line_end).group()
+            for next_line in lookahead.split("\n")[1:]:
+                # strip() returns the line itself (no copy) when there is
+                # nothing to trim, so this only allocates for padded lines
+                next_line = next_line.strip()
+                if not next_line or next_line == "​":  # Skip empty/zero-width
+                    continue
 
-            # Look for empty event links: [ ](https://luma.com/eventid)
-            # These mark the start of a new event
-            link_match = re.search(r"\[\s*\]\((https://luma\.com/[a-zA-Z0-9_-]+)\)", line)
-            if link_match:
-                # Save previous event if exists
-                if current_event.get("title") and current_event.get("url"):
-                    event = self._create_event(current_event)
-                    if event:
-                        events.append(event)
-
-                # Start new event with current section date
-                current_event = {
-                    "title": None,
-                    "url": link_match.group(1).strip(),
-                    "date": current_date,
-                    "time": None,
-                    "location": None,
-                }
-
-                # Look ahead for title, time, location
-                for j in range(i + 1, min(i + 15, len(lines))):
-                    next_line = lines[j].strip()
-                    if not next_line or next_line == "​":  # Skip empty/zero-width
-                        continue
+                if next_line[0] in LINE_RE_FIRST_CHARS:
+                    line_match = LINE_RE.match(next_line)
+                    kind = line_match.lastgroup if line_match else None
+                else:
+                    kind = None
 
-                    # Title is in ### heading format
-                    title_match = re.match(r"^###\s+(.+)$", next_line)
-                    if title_match and not current_event.get("title"):
-                        current_event["title"] = title_match.group(1).strip()
+                # Title is in ### heading format
+                if kind == "title":
+                    if not title:
+                        title = line_match.group("title_text")
                         continue
 
-                    # Time pattern like "5:00 PM" or "6:00 PM PST"
-                    time_match = re.match(
-                        r"^(\d{1,2}:\d{2}\s*(AM|PM)(\s+[A-Z]{3})?)$",
-                        next_line,
-                        re.IGNORECASE,
-                    )
-                    if time_match and not current_event.get("time"):
-                        current_event["time"] = time_match.group(1).strip()
+                # Time pattern like "5:00 PM" or "6:00 PM PST"
+                elif kind == "time":
+                    if not time_str:
+                        time_str = line_match.group("time")
                         continue
 
-                    # Skip "By Author" lines
-                    if next_line.startswith("By "):
-                        continue
-
-                    # Skip lines that look like attendee counts
-                    if re.match(r"^\+\d+$", next_line):
-                        continue
+                # Skip "By Author" lines and attendee counts like "+12"
+                elif kind in ("author", "attendee"):
+                    continue
 
-                    # Skip status badges
-                    if next_line in ["Waitlist", "Going", "Interested", "Sold Out"]:
-                        continue
+                # Skip status badges
+                if next_line in STATUS_BADGES:
+                    continue
 
-                    # Location: moderate-length text that isn't a title or time
-                    if (
-                        not current_event.get("location")
-                        and current_event.get("title")
-                        and 3 < len(next_line) < 100
-                        and not next_line.startswith("#")
-                        and not next_line.startswith("[")
-                    ):
-                        current_event["location"] = next_line
-                        break  # Location is typically last, stop looking
-
-            i += 1
-
-        # Don't forget the last event
-        if current_event.get("title") and current_event.get("url"):
-            event = self._create_event(current_event)
-            if event:
-                events.append(event)
+                # Location: moderate-length text that isn't a title or time
+                if (
+                    not location
+                    and title
+                    and 3 < len(next_line) < 100
+                    and not next_line.startswith(("#", "["))
+                ):
+                    location = next_line
+                    break  # Location is typically last, stop looking
+
+            if title:
+                events.append(
+                    self._create_event(
+                        title, marker.group("url"), current_date, time_str, location, now
+                    )
+                )
 
         return events
 
-    def _create_event(self, data: dict[str, str | datetime | None]) -> Event | None:
-        """Create an Event object from parsed data.
+    def _create_event(
+        self,
+        title: str,
+        url: str,
+        date_value: datetime | str | None = None,
+        time_str: str | None = None,
+        location: str | None = None,
+        now: datetime | None = None,
+    ) -> Event:
+        """Create an Event object from parsed fields.
 
         Args:
-            data: Dictionary with event data.
+            title: Event title.
+            url: Event URL.
+            date_value: Section date, or a date string like "Jan 28".
+            time_str: Start time like "6:00 PM PST".
+            location: Event location.
+            now: Reference time for the parse (defaults to the current time).
 
         Returns:
-            Event object or None if required fields are missing.
+            Event object.
         """
-        title = data.get("title")
-        url = data.get("url")
-
-        if not title or not url:
-            return None
+        if now is None:
+            now = datetime.now()
 
         # Use provided date or fall back to current date
-        event_date = datetime.now()
-        date_value = data.get("date")
+        event_date = now
         if isinstance(date_value, datetime):
             event_date = date_value
         elif isinstance(date_value, str):
-            # Try to parse string date formats
-            for fmt in ["%b %d", "%B %d", "%b %d, %Y", "%B %d, %Y"]:
+            # Parse string dates like "Jan 28", "January 28" or "Jan 28, 2026"
+            date_match = EVENT_DATE_RE.match(date_value.strip())
+            if date_match:
+                month = MONTHS[date_match.group(1)[:3].lower()]
+                day = int(date_match.group(2))
+                year = date_match.group(3)
                 try:
-                    parsed = datetime.strptime(date_value.strip(), fmt)
-                    if parsed.year == 1900:
-                        current_year = datetime.now().year
-                        parsed = parsed.replace(year=current_year)
-                        if parsed < datetime.now():
-                            parsed = parsed.replace(year=current_year + 1)
-                    event_date = parsed
-                    break
+                    if year:
+                        event_date = datetime(int(year), month, day)
+                    else:
+                        parsed = datetime(now.year, month, day)
+                        # If date is in the past, assume next year
+                        if parsed < now:
+                            parsed = parsed.replace(year=now.year + 1)
+                        event_date = parsed
                 except ValueError:
-                    continue
+                    pass
 
         return Event(
-            id=str(uuid.uuid4()),
-            title=str(title),
+            id=make_event_id(self.name, url, event_date),
+            title=title,
             description=None,
             date=event_date,
-            time=str(data.get("time")) if data.get("time") else None,
-            location=str(data.get("location")) if data.get("location") else None,
-            url=str(url),
+            time=time_str,
+            location=location,
+            url=url,
             source=self.name,
             tags=[],
         )
@@ -1,13 +1,19 @@
 """Claude AI service with tool calling for event discovery."""
 
-import json
+import asyncio
 import logging
 import os
-from datetime import datetime
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 from zoneinfo import ZoneInfo
 
 import anthropic
+import orjson
 
 from backend.models import Event
 from backend.services.mcp_client import (
@@ -23,6 +29,38 @@ SF_TZ = ZoneInfo("America/Los_Angeles")
 # Message type for conversation history
 MessageDict = dict[str, Any]
 
+# Models: the tool-calling assistant, and a fast model for small talk
+CHAT_MODEL = "claude-sonnet-4-20250514"
+FAST_MODEL = "claude-haiku-4-5-20251001"
+
+# Greetings, thanks and sign-offs that never need tools or event data.
+# Bare affirmatives ("ok", "sure") are left out: they often answer an offer
+# like "Want me to set a reminder?" and need the full assistant.
+SIMPLE_MESSAGE_RE = re.compile(
+    r"^\s*(?:hi|hello|hey|good (?:morning|afternoon|evening)|thanks?|thank you|thx"
+    r"|bye|goodbye|see you)"
+    r"(?:\s+(?:so much|a lot|there|again))?[\s!.,:)]*$",
+    re.IGNORECASE,
+)
+
+SIMPLE_SYSTEM_PROMPT = """You are Schedule Hacker, an AI assistant that helps users discover events and set up reminders.
+Reply briefly and warmly. If it fits, invite the user to say what kind of events they are looking for."""
+
+# History sent with each request is capped at this many messages and
+# (roughly estimated) tokens, so per-turn cost stays flat in long chats
+MAX_HISTORY_MESSAGES = 20
+MAX_HISTORY_TOKENS = 8000
+
+# Upper bound on requests per chat turn. A turn normally needs at most
+# search -> display -> respond, plus a reminder or plugin call.
+MAX_TOOL_ITERATIONS = 5
+
+# A streamed response that sends nothing for this long (seconds) is abandoned
+STREAM_IDLE_TIMEOUT = 30.0
+
+# Shared client, created on first use so its connection pool is reused
+_client: anthropic.AsyncAnthropic | None = None
+
 # Tool definitions for Claude
 TOOLS = [
     {
@@ -110,10 +148,20 @@ TOOLS = [
     },
 ]
 
-SYSTEM_PROMPT_TEMPLATE = """You are Schedule Hacker, an AI assistant that helps users discover events and set up reminders.
+# Tool definitions never change at runtime; freeze them so no request can
+# mutate the shared list the SDK encodes on every call
+TOOLS = tuple(
+    MappingProxyType({**tool, "input_schema": MappingProxyType(tool["input_schema"])})
+    for tool in TOOLS
+)
+
+# Tools without side effects. A turn that called any other tool (reminders,
+# notifications, plugin creation) must not be replayed from a cache.
+READ_ONLY_TOOLS = frozenset({"search_events", "display_events"})
 
-## Current Date and Time
-Today is {current_date} ({current_day}). Use this to correctly interpret relative dates like "this weekend", "next week", "tomorrow", etc.
+# Static part of the system prompt. Kept free of per-request values so it is
+# built once and stays byte-identical across requests.
+SYSTEM_PROMPT = """You are Schedule Hacker, an AI assistant that helps users discover events and set up reminders.
 
 ## Your Capabilities
 You have access to tools that let you:
@@ -170,257 +218,553 @@ When scheduling reminders:
 - Be concise but informative
 - Proactively offer to schedule reminders for events the user is interested in"""
 
+# Per-request part of the system prompt, appended after SYSTEM_PROMPT
+DATE_PROMPT_TEMPLATE = """## Current Date and Time
+Today is {current_date} ({current_day}). Use this to correctly interpret relative dates like "this weekend", "next week", "tomorrow", etc."""
 
-def get_system_prompt() -> str:
-    """Get the system prompt with current date/time."""
-    now = datetime.now(SF_TZ)
-    current_date = now.strftime("%B %d, %Y")  # e.g., "January 26, 2026"
-    current_day = now.strftime("%A")  # e.g., "Monday"
-    return SYSTEM_PROMPT_TEMPLATE.format(
+
+# Request options shared by every tool-calling request
+_BASE_REQUEST: MappingProxyType[str, Any] = MappingProxyType({
+    "model": CHAT_MODEL,
+    "max_tokens": 4096,
+    "tools": TOOLS,
+})
+
+# Static system block, marked for prompt caching. The cache breakpoint
+# covers everything before it too, i.e. the TOOLS definitions.
+SYSTEM_PROMPT_BLOCK = {
+    "type": "text",
+    "text": SYSTEM_PROMPT,
+    "cache_control": {"type": "ephemeral"},
+}
+
+
+@lru_cache(maxsize=1)
+def _build_system_prompt(current_date: str, current_day: str) -> list[dict[str, Any]]:
+    """Build the system prompt blocks for a given day (cached until the day changes)."""
+    date_prompt = DATE_PROMPT_TEMPLATE.format(
         current_date=current_date,
         current_day=current_day,
     )
+    return [SYSTEM_PROMPT_BLOCK, {"type": "text", "text": date_prompt}]
+
 
+def get_system_prompt() -> list[dict[str, Any]]:
+    """Get the system prompt blocks: the cached static prompt, then the current date."""
+    now = datetime.now(SF_TZ)
+    current_date = now.strftime("%B %d, %Y")  # e.g., "January 26, 2026"
+    current_day = now.strftime("%A")  # e.g., "Monday"
+    return _build_system_prompt(current_date, current_day)
+
+
+def get_anthropic_client() -> anthropic.AsyncAnthropic:
+    """Get the shared async Anthropic client, creating it on first use."""
+    global _client
+    if _client is None:
+        api_key = os.environ.get("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY environment variable is not set")
+        _client = anthropic.AsyncAnthropic(api_key=api_key)
+    return _client
 
-def get_anthropic_client() -> anthropic.Anthropic:
-    """Get the Anthropic client with API key from environment."""
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY environment variable is not set")
-    return anthropic.Anthropic(api_key=api_key)
+
+async def close_anthropic_client() -> None:
+    """Close the shared Anthropic client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+        logger.info("Closed Anthropic client")
 
 
 def format_events_for_tool_response(events: list[Event]) -> str:
     """Format events as a structured response for the tool result."""
     if not events:
-        return json.dumps({"events": [], "message": "No events found from current sources."})
-
-    events_data = []
-    for event in events:
-        # Include both date and day name so the AI doesn't have to guess
-        date_str = None
-        day_name = None
-        if event.date:
-            date_str = event.date.strftime("%Y-%m-%d")
-            day_name = event.date.strftime("%A")  # e.g., "Monday"
-
-        event_dict = {
-            "id": event.id,  # Include ID so Claude can select events
-            "title": event.title,
-            "url": event.url,
-            "date": date_str,
-            "day": day_name,
-            "time": event.time,
-            "location": event.location,
-            "description": event.description,
-            "source": event.source,
-        }
-        events_data.append(event_dict)
+        return orjson.dumps({"events": [], "message": "No events found from current sources."}).decode()
 
-    return json.dumps({
+    events_data = [event.tool_data for event in events]
+
+    return orjson.dumps({
         "events": events_data,
         "count": len(events_data),
         "message": f"Found {len(events_data)} events. Use display_events with the IDs of relevant events to show them as cards.",
-    })
+    }).decode()
+
+
+# Tool handler result: (tool result string, events if any, selected event IDs if any)
+ToolResult = tuple[str, list[Event], list[str] | None]
+
+
+@dataclass(frozen=True, slots=True)
+class ToolContext:
+    """Per-turn dependencies shared by the tool handlers.
+
+    Attributes:
+        search_function: Async function that searches events for a query
+            and returns them with their formatted tool result.
+        create_plugin_function: Async function to create a plugin.
+        search_cache: Per-turn memo of search_events results, keyed by
+            normalized query.
+    """
+
+    search_function: Callable[[str | None], Awaitable[tuple[str, list[Event]]]]
+    create_plugin_function: Callable[[str], Awaitable[str]]
+    search_cache: dict[str, tuple[str, list[Event]]] = field(default_factory=dict)
+
+
+async def _search_events_tool(
+    tool_input: dict[str, Any],
+    context: ToolContext,
+) -> ToolResult:
+    """Run the search_events tool, reusing this turn's earlier results."""
+    query = tool_input.get("query")
+    logger.info("Tool call: search_events(query=%s)", query)
+    cache_key = (query or "").strip().lower()
+    cached = context.search_cache.get(cache_key)
+    if cached is not None:
+        tool_result, events = cached
+        return tool_result, events, None
+
+    tool_result, events = await context.search_function(query)
+    context.search_cache[cache_key] = (tool_result, events)
+    return tool_result, events, None
+
+
+async def _display_events_tool(
+    tool_input: dict[str, Any],
+    context: ToolContext,
+) -> ToolResult:
+    """Run the display_events tool.
+
+    Pure UI selection: the result is only an acknowledgement, which lets
+    the chat loop skip sending it back to Claude.
+    """
+    event_ids = tool_input.get("event_ids", [])
+    logger.info("Tool call: display_events(ids=%s)", event_ids)
+    return orjson.dumps({"success": True, "selected_count": len(event_ids)}).decode(), [], event_ids
+
+
+async def _create_plugin_tool(
+    tool_input: dict[str, Any],
+    context: ToolContext,
+) -> ToolResult:
+    """Run the create_plugin tool."""
+    url = tool_input.get("url", "")
+    logger.info("Tool call: create_plugin(url=%s)", url)
+    result = await context.create_plugin_function(url)
+    return orjson.dumps({"result": result}).decode(), [], None
+
+
+async def _schedule_event_reminder_tool(
+    tool_input: dict[str, Any],
+    context: ToolContext,
+) -> ToolResult:
+    """Run the schedule_event_reminder tool."""
+    event_title = tool_input.get("event_title", "")
+    event_time = tool_input.get("event_time", "")
+    delay = tool_input.get("delay", "")
+    logger.info("Tool call: schedule_event_reminder(title=%s, delay=%s)", event_title, delay)
+    result = await schedule_event_notification(event_title, event_time, delay)
+    return orjson.dumps(result).decode(), [], None
+
+
+async def _send_notification_tool(
+    tool_input: dict[str, Any],
+    context: ToolContext,
+) -> ToolResult:
+    """Run the send_notification tool."""
+    message = tool_input.get("message", "")
+    title = tool_input.get("title")
+    logger.info("Tool call: send_notification(message=%.50s...)", message)
+    result = await send_immediate_notification(message, title)
+    return orjson.dumps(result).decode(), [], None
+
+
+# Tool name -> handler, one entry per tool in TOOLS
+_TOOL_DISPATCH: dict[str, Callable[[dict[str, Any], ToolContext], Awaitable[ToolResult]]] = {
+    "search_events": _search_events_tool,
+    "display_events": _display_events_tool,
+    "create_plugin": _create_plugin_tool,
+    "schedule_event_reminder": _schedule_event_reminder_tool,
+    "send_notification": _send_notification_tool,
+}
 
 
 async def handle_tool_call(
     tool_name: str,
     tool_input: dict[str, Any],
-    scrape_function: Any,
-    create_plugin_function: Any,
-    all_events: list[Event] | None = None,
-) -> tuple[str, list[Event], list[str] | None]:
+    context: ToolContext,
+) -> ToolResult:
     """Handle a tool call and return the result.
 
     Args:
         tool_name: Name of the tool to call.
         tool_input: Input parameters for the tool.
-        scrape_function: Async function to scrape events.
-        create_plugin_function: Async function to create a plugin.
-        all_events: List of all events from previous search (for display_events).
+        context: Dependencies and per-turn state for the handlers.
 
     Returns:
         Tuple of (tool result string, list of events if any, selected event IDs if any).
     """
-    events: list[Event] = []
-    selected_ids: list[str] | None = None
-
-    if tool_name == "search_events":
-        query = tool_input.get("query")
-        logger.info(f"Tool call: search_events(query={query})")
-        events = await scrape_function(query=query)
-        return format_events_for_tool_response(events), events, None
-
-    elif tool_name == "display_events":
-        event_ids = tool_input.get("event_ids", [])
-        logger.info(f"Tool call: display_events(ids={event_ids})")
-        selected_ids = event_ids
-        return json.dumps({"success": True, "selected_count": len(event_ids)}), [], selected_ids
-
-    elif tool_name == "create_plugin":
-        url = tool_input.get("url", "")
-        logger.info(f"Tool call: create_plugin(url={url})")
-        result = await create_plugin_function(url)
-        return json.dumps({"result": result}), [], None
-
-    elif tool_name == "schedule_event_reminder":
-        event_title = tool_input.get("event_title", "")
-        event_time = tool_input.get("event_time", "")
-        delay = tool_input.get("delay", "")
-        logger.info(f"Tool call: schedule_event_reminder(title={event_title}, delay={delay})")
-        result = await schedule_event_notification(event_title, event_time, delay)
-        return json.dumps(result), [], None
-
-    elif tool_name == "send_notification":
-        message = tool_input.get("message", "")
-        title = tool_input.get("title")
-        logger.info(f"Tool call: send_notification(message={message[:50]}...)")
-        result = await send_immediate_notification(message, title)
-        return json.dumps(result), [], None
-
-    else:
-        logger.warning(f"Unknown tool: {tool_name}")
-        return json.dumps({"error": f"Unknown tool: {tool_name}"}), [], None
+    handler = _TOOL_DISPATCH.get(tool_name)
+    if handler is None:
+        logger.warning("Unknown tool: %s", tool_name)
+        return orjson.dumps({"error": f"Unknown tool: {tool_name}"}).decode(), [], None
 
+    return await handler(tool_input, context)
 
-async def chat_with_tools(
+
+def _is_simple(message: str) -> bool:
+    """Check whether a message is small talk that needs no tools."""
+    return len(message) < 40 and SIMPLE_MESSAGE_RE.match(message) is not None
+
+
+async def _with_idle_timeout(
+    events: AsyncIterator[Any],
+    timeout: float = STREAM_IDLE_TIMEOUT,
+) -> AsyncIterator[Any]:
+    """Re-yield stream events, giving up if the stream goes quiet.
+
+    Args:
+        events: Async iterator of stream events.
+        timeout: Maximum seconds to wait for the next event.
+
+    Yields:
+        The events from the stream, in order.
+
+    Raises:
+        TimeoutError: If no event arrives within timeout seconds.
+    """
+    iterator = aiter(events)
+    while True:
+        try:
+            event = await asyncio.wait_for(anext(iterator), timeout)
+        except StopAsyncIteration:
+            return
+        yield event
+
+
+def _log_usage(response: anthropic.types.Message) -> None:
+    """Log token usage of a response, including prompt cache reads and writes."""
+    usage = response.usage
+    logger.info(
+        "Claude usage: input=%d cache_read=%s cache_write=%s output=%d",
+        usage.input_tokens,
+        usage.cache_read_input_tokens,
+        usage.cache_creation_input_tokens,
+        usage.output_tokens,
+    )
+
+
+def _estimate_tokens(message: MessageDict) -> int:
+    """Roughly estimate the token count of a message (~4 characters per token)."""
+    content = message["content"]
+    if not isinstance(content, str):
+        content = str(content)
+    return len(content) // 4 + 1
+
+
+def _is_tool_result(message: MessageDict) -> bool:
+    """Check whether a message carries tool results."""
+    content = message["content"]
+    return isinstance(content, list) and any(
+        isinstance(block, dict) and block.get("type") == "tool_result"
+        for block in content
+    )
+
+
+def _truncate_history(
+    history: list[MessageDict],
+    max_messages: int = MAX_HISTORY_MESSAGES,
+    max_tokens: int = MAX_HISTORY_TOKENS,
+) -> list[MessageDict]:
+    """Keep only the most recent part of a conversation history.
+
+    Walks backward from the newest message until either cap is hit. The
+    kept slice always starts with a plain user message, so a tool_result
+    is never separated from the tool_use it answers.
+
+    Args:
+        history: Conversation history, oldest first.
+        max_messages: Maximum number of messages to keep.
+        max_tokens: Maximum estimated tokens to keep.
+
+    Returns:
+        The most recent messages of history, oldest first.
+    """
+    start = len(history)
+    tokens = 0
+    for index in range(len(history) - 1, -1, -1):
+        tokens += _estimate_tokens(history[index])
+        if len(history) - index > max_messages or tokens > max_tokens:
+            break
+        start = index
+
+    while start < len(history) and (
+        history[start]["role"] != "user" or _is_tool_result(history[start])
+    ):
+        start += 1
+
+    return history[start:]
+
+
+async def stream_chat_with_tools(
     message: str,
     conversation_history: list[MessageDict] | None = None,
-    scrape_function: Any = None,
+    search_function: Any = None,
     create_plugin_function: Any = None,
-) -> tuple[str, list[Event]]:
-    """Send a message to Claude with tool calling support.
+) -> AsyncIterator[tuple[str, Any]]:
+    """Send a message to Claude with tool calling support, streaming the reply.
+
+    Every request in the agentic loop is streamed, so text reaches the
+    caller as soon as Claude produces it instead of after the full message.
 
     Args:
         message: The user's message.
         conversation_history: Optional conversation history.
-        scrape_function: Async function to scrape events.
+        search_function: Async function that returns (tool result, events)
+            for a search query.
         create_plugin_function: Async function to create plugins.
 
-    Returns:
-        Tuple of (AI response text, list of events).
+    Yields:
+        ("text", chunk) for each piece of response text, ("tool_use", tool
+        names) when the text streamed so far was a preamble to tool calls,
+        and a final ("events", list of events).
     """
+    # Small talk goes to the fast model without tools or the full prompt
+    if _is_simple(message):
+        async for chunk in stream_message(
+            message,
+            conversation_history,
+            system_prompt=SIMPLE_SYSTEM_PROMPT,
+            model=FAST_MODEL,
+        ):
+            yield "text", chunk
+        yield "events", []
+        return
+
+    # Events seen this turn keyed by ID, and the selected IDs in display order
+    all_events: dict[str, Event] = {}
+    selected_event_ids: dict[str, None] = {}
+
     try:
         client = get_anthropic_client()
-        all_events: list[Event] = []
-        selected_event_ids: set[str] = set()
-
-        # Build messages list
-        messages: list[dict[str, Any]] = []
+        # Tool dependencies, plus a memo so repeated searches within this
+        # turn reuse the first result
+        tool_context = ToolContext(search_function, create_plugin_function)
+
+        # Recent history plus the current user message, built in one pass
+        history = _truncate_history(conversation_history or [])
+        messages: list[dict[str, Any]] = [
+            *history,
+            {"role": "user", "content": [{"type": "text", "text": message}]},
+        ]
         if conversation_history:
-            messages.extend(conversation_history)
-            logger.info(f"Loaded {len(conversation_history)} messages from history")
+            logger.info("Loaded %d of %d messages from history", len(history), len(conversation_history))
 
-        # Add current user message
-        messages.append({"role": "user", "content": message})
-        logger.info(f"Total messages being sent to Claude: {len(messages)}")
+        # Same prompt for every iteration of this turn
+        system_prompt = get_system_prompt()
+
+        # Block carrying the conversation cache breakpoint. Blocks created in
+        # this turn are ours to mark; history entries are never touched.
+        cached_block: dict[str, Any] | None = None
 
         # Agentic loop - keep processing until we get a final response
-        max_iterations = 10  # Increased to allow for search + display calls
-        for _ in range(max_iterations):
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                system=get_system_prompt(),
-                tools=TOOLS,
+        for _ in range(MAX_TOOL_ITERATIONS):
+            # Move the breakpoint to the newest block, so each request in the
+            # loop reads everything before it from the prompt cache and only
+            # prefills the latest tool results
+            if cached_block is not None:
+                del cached_block["cache_control"]
+            cached_block = messages[-1]["content"][-1]
+            cached_block["cache_control"] = {"type": "ephemeral"}
+
+            streamed_text = False
+            async with client.messages.stream(
+                **_BASE_REQUEST,
+                system=system_prompt,
                 messages=messages,
-            )
+            ) as stream:
+                # Iterate all stream events (tool input deltas included) so
+                # the idle timer only fires when the stream has stalled
+                async for event in _with_idle_timeout(stream):
+                    if event.type == "text":
+                        streamed_text = True
+                        yield "text", event.text
+                response = await stream.get_final_message()
+
+            _log_usage(response)
 
             # Check if Claude wants to use a tool
             if response.stop_reason == "tool_use":
+                tool_blocks = [block for block in response.content if block.type == "tool_use"]
+
+                # display_events only selects cards; its result carries nothing
+                # Claude needs. When it is the only tool called and the answer
+                # text is already here, finish without another round-trip.
+                display_only = streamed_text and all(
+                    block.name == "display_events" for block in tool_blocks
+                )
+                if not display_only:
+                    yield "tool_use", [block.name for block in tool_blocks]
+
                 # Process all tool uses in the response
                 assistant_content = response.content
                 messages.append({"role": "assistant", "content": assistant_content})
 
+                # Tools in one turn are independent, so run them concurrently
+                results = await asyncio.gather(*(
+                    handle_tool_call(block.name, block.input, tool_context)
+                    for block in tool_blocks
+                ), return_exceptions=True)
+
+                # Collect results in block order. A failed tool is reported
+                # to Claude as an error result instead of ending the turn;
+                # that includes a tool that was cancelled on its own, which
+                # gather returns as a CancelledError value.
                 tool_results = []
-                for block in response.content:
-                    if block.type == "tool_use":
-                        tool_result, events, selected_ids = await handle_tool_call(
-                            tool_name=block.name,
-                            tool_input=block.input,
-                            scrape_function=scrape_function,
-                            create_plugin_function=create_plugin_function,
-                            all_events=all_events,
-                        )
-                        all_events.extend(events)
-                        if selected_ids:
-                            selected_event_ids.update(selected_ids)
+                for block, result in zip(tool_blocks, results):
+                    if isinstance(result, BaseException):
+                        logger.error("Tool %s failed: %s", block.name, result)
                         tool_results.append({
                             "type": "tool_result",
                             "tool_use_id": block.id,
-                            "content": tool_result,
+                            "content": f"Tool {block.name} failed: {result}",
+                            "is_error": True,
                         })
+                        continue
+
+                    tool_result, events, selected_ids = result
+                    all_events.update((event.id, event) for event in events)
+                    if selected_ids:
+                        selected_event_ids.update(dict.fromkeys(selected_ids))
+                    tool_results.append({
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": tool_result,
+                    })
+
+                if display_only:
+                    break
 
                 # Add tool results to messages
                 messages.append({"role": "user", "content": tool_results})
 
             else:
-                # Claude is done - extract final text response
-                # Filter events to only include selected ones
-                if selected_event_ids:
-                    filtered_events = [e for e in all_events if e.id in selected_event_ids]
-                    logger.info(f"Filtered to {len(filtered_events)} selected events from {len(all_events)} total")
-                else:
-                    filtered_events = []  # No events selected = no cards shown
-
-                for block in response.content:
-                    if hasattr(block, "text"):
-                        return block.text, filtered_events
-
-                return "I couldn't generate a response.", filtered_events
-
-        logger.warning("Max iterations reached in tool calling loop")
-        # Filter events even if we hit max iterations
-        if selected_event_ids:
-            filtered_events = [e for e in all_events if e.id in selected_event_ids]
+                # Claude is done - the final text has already been streamed
+                if not streamed_text:
+                    yield "text", "I couldn't generate a response."
+                break
+
         else:
-            filtered_events = []
-        return "I encountered an issue processing your request. Please try again.", filtered_events
+            logger.warning("Max iterations (%d) reached in tool calling loop", MAX_TOOL_ITERATIONS)
+            yield "text", "I encountered an issue processing your request. Please try again."
 
     except anthropic.AuthenticationError as e:
-        logger.error(f"Authentication error: {e}")
+        logger.error("Authentication error: %s", e)
         raise ValueError("Invalid ANTHROPIC_API_KEY") from e
 
     except anthropic.RateLimitError:
-        return "I'm experiencing high demand. Please try again in a moment.", []
+        yield "text", "I'm experiencing high demand. Please try again in a moment."
+        selected_event_ids.clear()
 
-    except anthropic.APIError as e:
-        logger.error(f"API error: {e}")
-        return "I encountered an error. Please try again later.", []
+    except TimeoutError:
+        logger.error("Response stream idle for over %ss", STREAM_IDLE_TIMEOUT)
+        yield "text", "The response took too long. Please try again."
+        selected_event_ids.clear()
 
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        return f"I encountered an unexpected error: {e}", []
+    except anthropic.APIConnectionError as e:
+        logger.error("API connection error: %s", e)
+        yield "text", "I couldn't reach the AI service. Please check your connection and try again."
+        selected_event_ids.clear()
 
+    except anthropic.APIError as e:
+        logger.error("API error: %s", e)
+        yield "text", "I encountered an error. Please try again later."
+        selected_event_ids.clear()
+
+    # Filter events to only include selected ones (no selection = no cards).
+    # The same listing can come from several sources under different IDs, so
+    # selected events are also collapsed by URL and day.
+    displayed: dict[tuple[str, date], Event] = {}
+    for event_id in selected_event_ids:
+        event = all_events.get(event_id)
+        if event is not None:
+            displayed.setdefault((event.url, event.date.date()), event)
+    filtered_events = list(displayed.values())
+    if filtered_events:
+        logger.info("Filtered to %d selected events from %d total", len(filtered_events), len(all_events))
+    yield "events", filtered_events
 
-async def send_message(
+
+async def chat_with_tools(
     message: str,
     conversation_history: list[MessageDict] | None = None,
-    system_prompt: str | None = None,
-) -> str:
-    """Send a simple message to Claude without tools.
+    search_function: Any = None,
+    create_plugin_function: Any = None,
+) -> tuple[str, list[Event]]:
+    """Send a message to Claude with tool calling support.
+
+    Collects the output of stream_chat_with_tools for callers that need
+    the complete response.
 
     Args:
         message: The user's message.
         conversation_history: Optional conversation history.
-        system_prompt: Optional system prompt.
+        search_function: Async function that returns (tool result, events)
+            for a search query.
+        create_plugin_function: Async function to create plugins.
 
     Returns:
-        Claude's response text.
+        Tuple of (AI response text, list of events).
+    """
+    chunks: list[str] = []
+    events: list[Event] = []
+    async for kind, value in stream_chat_with_tools(
+        message,
+        conversation_history,
+        search_function,
+        create_plugin_function,
+    ):
+        if kind == "text":
+            chunks.append(value)
+        elif kind == "tool_use":
+            # Only the text after the last tool round is the answer
+            chunks.clear()
+        elif kind == "events":
+            events = value
+    return "".join(chunks), events
+
+
+async def stream_message(
+    message: str,
+    conversation_history: list[MessageDict] | None = None,
+    system_prompt: str | list[dict[str, Any]] | None = None,
+    model: str = CHAT_MODEL,
+) -> AsyncIterator[str]:
+    """Send a simple message to Claude without tools, streaming the reply.
+
+    Args:
+        message: The user's message.
+        conversation_history: Optional conversation history.
+        system_prompt: Optional system prompt, as a string or as content
+            blocks (e.g. with cache_control on a static prefix).
+        model: Model to use.
+
+    Yields:
+        Chunks of Claude's response text.
     """
     try:
         client = get_anthropic_client()
 
-        messages: list[dict[str, Any]] = []
-        if conversation_history:
-            for msg in conversation_history:
-                messages.append({"role": msg["role"], "content": msg["content"]})
-
-        messages.append({"role": "user", "content": message})
+        # History entries are already {"role", "content"} dicts; the SDK
+        # does not mutate them, so they are passed through as-is
+        messages: list[dict[str, Any]] = [
+            *_truncate_history(conversation_history or []),
+            {"role": "user", "content": message},
+        ]
 
         request_kwargs: dict[str, Any] = {
-            "model": "claude-sonnet-4-20250514",
+            "model": model,
             "max_tokens": 4096,
             "messages": messages,
         }
@@ -428,16 +772,44 @@ async def send_message(
         if system_prompt:
             request_kwargs["system"] = system_prompt
 
-        response = client.messages.create(**request_kwargs)
-
-        if response.content:
-            block = response.content[0]
-            if hasattr(block, "text"):
-                return block.text
-            return str(block)
+        streamed_text = False
+        async with client.messages.stream(**request_kwargs) as stream:
+            async for event in _with_idle_timeout(stream):
+                if event.type == "text":
+                    streamed_text = True
+                    yield event.text
+            _log_usage(await stream.get_final_message())
 
-        return "I couldn't generate a response."
+        if not streamed_text:
+            yield "I couldn't generate a response."
 
     except Exception as e:
-        logger.error(f"Error in send_message: {e}")
-        return f"I encountered an error: {e}"
+        logger.error("Error in send_message: %s", e)
+        yield f"I encountered an error: {e}"
+
+
+async def send_message(
+    message: str,
+    conversation_history: list[MessageDict] | None = None,
+    system_prompt: str | list[dict[str, Any]] | None = None,
+    model: str = CHAT_MODEL,
+) -> str:
+    """Send a simple message to Claude without tools.
+
+    The response is streamed from the API with the async client, so the
+    event loop is never blocked while the completion is generated.
+
+    Args:
+        message: The user's message.
+        conversation_history: Optional conversation history.
+        system_prompt: Optional system prompt (string or content blocks).
+        model: Model to use.
+
+    Returns:
+        Claude's response text.
+    """
+    chunks = [
+        chunk
+        async for chunk in stream_message(message, conversation_history, system_prompt, model)
+    ]
+    return "".join(chunks)
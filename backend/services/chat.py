@@ -1,66 +1,382 @@
 """Chat service for managing conversations and AI interactions."""
 
 import asyncio
+import hashlib
 import logging
 import re
+import time
 import uuid
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse, quote_plus
 
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig
+from crawl4ai import CrawlerRunConfig
 
 from backend.models import Event
-from backend.services.ai import chat_with_tools, send_message
+from backend.plugins.base import ScraperPlugin
+from backend.services.ai import (
+    MAX_HISTORY_MESSAGES,
+    READ_ONLY_TOOLS,
+    format_events_for_tool_response,
+    send_message,
+    stream_chat_with_tools,
+)
+from backend.services.crawler import crawl_markdown
 from backend.services.plugin_loader import (
     get_plugin_registry,
     get_plugins_directory,
     load_plugin_from_file,
     reload_plugins,
 )
+from backend.services.response_cache import (
+    cache_response,
+    clear_cached_responses,
+    get_cached_response,
+)
 
 logger = logging.getLogger(__name__)
 
-# In-memory storage for conversations
-_conversations: dict[str, list[dict[str, Any]]] = {}
+# Conversations idle for longer than this are dropped (seconds)
+CONVERSATION_TTL = 3600.0
 
+# Bound on conversations kept in memory (least recently used are dropped)
+MAX_CONVERSATIONS = 10_000
 
-async def scrape_all_plugins(query: str | None = None) -> list[Event]:
-    """Scrape events from all loaded plugins concurrently.
+# Messages kept per conversation. Requests only send the newest
+# MAX_HISTORY_MESSAGES, so this leaves headroom without growing forever.
+MAX_STORED_MESSAGES = 2 * MAX_HISTORY_MESSAGES
+
+# In-memory storage for conversations, least recently used first:
+# conversation_id -> (last used timestamp, messages)
+_conversations: OrderedDict[str, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+
+# Maximum number of plugins scraped at the same time
+MAX_CONCURRENT_SCRAPES = 8
+
+# Longest a request waits for a single plugin (seconds)
+PLUGIN_SCRAPE_TIMEOUT = 30.0
+
+# Scrapes slower than this are logged (seconds)
+SLOW_SCRAPE_SECONDS = 10.0
+
+# How long scraped events are reused before crawling again (seconds)
+SCRAPE_CACHE_TTL = 600.0
+
+# Cache of scrape results: (plugin name, normalized query) -> (timestamp, events)
+_scrape_cache: dict[tuple[str, str], tuple[float, list[Event]]] = {}
+
+# Scrapes in progress, keyed like _scrape_cache, shared by concurrent callers
+_inflight_scrapes: dict[tuple[str, str], asyncio.Task[list[Event]]] = {}
+
+# Merged search results by normalized query: (the per-plugin event lists
+# they were built from, merged events, search_events tool result). Reused
+# while every plugin still returns the same list, so an entry lives exactly
+# as long as the scrape cache entries behind it.
+_search_results: dict[str, tuple[tuple[list[Event], ...], list[Event], str]] = {}
+
+# One reusable instance per plugin class (plugins keep no per-scrape state)
+_plugin_instances: dict[type[ScraperPlugin], ScraperPlugin] = {}
+
+# How often the background prefetcher refreshes popular queries (seconds)
+PREFETCH_INTERVAL = 240.0
+
+# Number of most-requested queries kept warm (in addition to the unfiltered scrape)
+PREFETCH_TOP_QUERIES = 3
+
+# Bound on distinct queries tracked for prefetching
+MAX_TRACKED_QUERIES = 500
+
+# How often each normalized query has been requested
+_query_counts: Counter[str] = Counter()
+
+# Page markdown sent to Claude for plugin generation is capped at this size
+MAX_STRUCTURE_CHARS = 8000
+
+# Markdown image: keeps the ![alt] part, matches the URL in parentheses
+IMAGE_URL_RE = re.compile(r"(!\[[^\]]*\])\([^)]*\)")
+
+# Markdown code fence around generated code (any language tag, closing
+# fence optional in case the response was cut off)
+CODE_FENCE_RE = re.compile(r"^```[\w+-]*\n?(.*?)\n?(?:```)?$", re.DOTALL)
+
+# Plugin creations (crawl + code generation + test scrape) running at once
+MAX_CONCURRENT_PLUGIN_CREATIONS = 3
+_plugin_creation_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PLUGIN_CREATIONS)
+
+# Plugin creations in progress by URL, shared by concurrent requests
+_inflight_plugin_creations: dict[str, asyncio.Task[str]] = {}
+
+# Code whose test scrape found events, by URL: (page markdown SHA-256, code)
+_plugin_code_cache: dict[str, tuple[str, str]] = {}
+
+# Domain cleanup for plugin filenames: separators become underscores, then
+# anything that is not a valid identifier character is dropped
+DOMAIN_SEPARATORS = str.maketrans(".-", "__")
+DOMAIN_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+
+def refresh_plugin_instances() -> None:
+    """Create one instance per loaded plugin class, replacing any old ones.
+
+    Called once plugins are loaded so the first chat does not pay for
+    instantiation. Classes that survived a reload keep their instance. A
+    plugin that fails to instantiate is skipped here and retried (and
+    reported) when it is scraped.
+    """
+    previous = dict(_plugin_instances)
+    _plugin_instances.clear()
+    for plugin_class in get_plugin_registry().values():
+        if plugin_class in previous:
+            _plugin_instances[plugin_class] = previous[plugin_class]
+            continue
+        try:
+            _plugin_instances[plugin_class] = plugin_class()
+        except Exception as e:
+            logger.error(f"Error instantiating plugin {plugin_class.name}: {e}")
+
+
+async def _run_scrape(
+    plugin_class: type[ScraperPlugin],
+    plugin_query: str | None,
+    cache_key: tuple[str, str],
+    semaphore: asyncio.Semaphore,
+) -> list[Event]:
+    """Scrape a plugin and store non-empty results in the scrape cache."""
+    plugin_instance = _plugin_instances.get(plugin_class)
+    if plugin_instance is None:
+        plugin_instance = _plugin_instances[plugin_class] = plugin_class()
+    async with semaphore:
+        if plugin_query:
+            events = await plugin_instance.scrape(query=plugin_query)
+        else:
+            events = await plugin_instance.scrape()
+
+    # Empty results are usually scrape errors, so they are not cached.
+    # Neither are results of a plugin that was replaced during the scrape.
+    if (
+        events
+        and plugin_class.cacheable
+        and get_plugin_registry().get(plugin_class.name) is plugin_class
+    ):
+        _scrape_cache[cache_key] = (time.monotonic(), events)
+    return events
+
+
+async def _scrape_plugin(
+    plugin_class: type[ScraperPlugin],
+    query: str | None,
+    semaphore: asyncio.Semaphore,
+    max_age: float = SCRAPE_CACHE_TTL,
+) -> list[Event]:
+    """Scrape a single plugin, reusing cached results younger than max_age.
+
+    Concurrent callers that miss the cache for the same plugin and query
+    share one scrape instead of each crawling the page. Plugins that opt
+    out of caching are always scraped.
+    """
+    # Plugins without search ignore the query, so they share one cache entry
+    plugin_query = query if plugin_class.supports_search and query else None
+    cache_key = (plugin_class.name, (plugin_query or "").strip().lower())
+    if plugin_class.cacheable:
+        cached = _scrape_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+
+    task = _inflight_scrapes.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(_run_scrape(plugin_class, plugin_query, cache_key, semaphore))
+        _inflight_scrapes[cache_key] = task
+
+        def forget(done: asyncio.Task[list[Event]]) -> None:
+            # The entry may already belong to a newer scrape
+            if _inflight_scrapes.get(cache_key) is done:
+                del _inflight_scrapes[cache_key]
+            # Mark a failure as retrieved even if every caller went away
+            if not done.cancelled():
+                done.exception()
+
+        task.add_done_callback(forget)
+
+    # Shielded so one caller going away does not cancel the shared scrape
+    return await asyncio.shield(task)
+
+
+def _forget_plugin_results(plugin_name: str) -> None:
+    """Drop cached and in-flight scrapes of a plugin.
+
+    Used when a plugin is replaced, so its old events are not served and
+    new requests do not join a scrape by the old code.
+    """
+    for cache_key in [key for key in _scrape_cache if key[0] == plugin_name]:
+        del _scrape_cache[cache_key]
+    for cache_key in [key for key in _inflight_scrapes if key[0] == plugin_name]:
+        del _inflight_scrapes[cache_key]
+
+
+async def iter_plugin_events(
+    query: str | None = None,
+    prefetch: bool = False,
+) -> AsyncIterator[tuple[str, list[Event]]]:
+    """Scrape all loaded plugins concurrently, yielding results as they finish.
+
+    Fast plugins are yielded immediately instead of waiting for the slowest
+    one. Plugins that fail are logged and yield an empty list.
 
     Args:
         query: Optional search query to pass to plugins that support searching.
+        prefetch: Background refresh; re-scrapes entries that would expire
+            before the next prefetch, skips plugins that are not cacheable
+            and does not count towards popularity.
 
-    Returns:
-        Combined list of events from all plugins.
+    Yields:
+        (plugin name, events) tuples in completion order.
     """
     registry = get_plugin_registry()
     if not registry:
         logger.warning("No plugins loaded in registry")
-        return []
+        return
 
-    # Create plugin instances and scrape concurrently
-    scrape_tasks = []
-    for plugin_class in registry.values():
-        plugin_instance = plugin_class()
-        if plugin_instance.supports_search and query:
-            scrape_tasks.append(plugin_instance.scrape(query=query))
-        else:
-            scrape_tasks.append(plugin_instance.scrape())
+    if prefetch:
+        max_age = SCRAPE_CACHE_TTL - PREFETCH_INTERVAL
+    else:
+        max_age = SCRAPE_CACHE_TTL
+        _record_query(query)
 
-    # Run all scrapes concurrently
-    results = await asyncio.gather(*scrape_tasks, return_exceptions=True)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+
+    async def scrape_named(
+        plugin_name: str, plugin_class: type[ScraperPlugin]
+    ) -> tuple[str, list[Event]]:
+        started = time.monotonic()
+        try:
+            events = await asyncio.wait_for(
+                _scrape_plugin(plugin_class, query, semaphore, max_age),
+                PLUGIN_SCRAPE_TIMEOUT,
+            )
+        except TimeoutError:
+            # The shared scrape keeps running and fills the cache for later
+            logger.warning(f"Scraping {plugin_name} took over {PLUGIN_SCRAPE_TIMEOUT}s, skipping it")
+            return plugin_name, []
+        except Exception as e:
+            logger.error(f"Error scraping {plugin_name}: {e}")
+            return plugin_name, []
+
+        elapsed = time.monotonic() - started
+        if elapsed > SLOW_SCRAPE_SECONDS:
+            logger.info(f"Slow scrape: {plugin_name} took {elapsed:.1f}s")
+        return plugin_name, events
+
+    # Run all scrapes concurrently, bounded by the semaphore. Prefetching
+    # skips plugins whose results are never cached.
+    tasks = [
+        asyncio.create_task(scrape_named(plugin_name, plugin_class))
+        for plugin_name, plugin_class in registry.items()
+        if plugin_class.cacheable or not prefetch
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            plugin_name, events = await next_done
+            logger.info(f"Scraped {len(events)} events from {plugin_name}")
+            yield plugin_name, events
+    finally:
+        # Stop outstanding scrapes if the consumer goes away early
+        for task in tasks:
+            task.cancel()
 
-    # Collect all events, logging any errors
-    all_events: list[Event] = []
-    for plugin_name, result in zip(registry.keys(), results):
-        if isinstance(result, Exception):
-            logger.error(f"Error scraping {plugin_name}: {result}")
-        elif isinstance(result, list):
-            all_events.extend(result)
-            logger.info(f"Scraped {len(result)} events from {plugin_name}")
 
-    return all_events
+async def search_events(query: str | None = None) -> tuple[str, list[Event]]:
+    """Scrape all loaded plugins and format the results for Claude.
+
+    When every plugin's events come from the same scrape cache entries as
+    last time, the merged events and tool result built from them are
+    reused instead of being merged, sorted and serialized again. Plugins
+    that opt out of caching return new events on every scrape, so searches
+    that include them are always rebuilt.
+
+    Args:
+        query: Optional search query to pass to plugins that support searching.
+
+    Returns:
+        Tuple of (search_events tool result, events from all plugins
+        deduplicated by ID and sorted by date).
+    """
+    registry = get_plugin_registry()
+    events_by_plugin: dict[str, list[Event]] = {}
+    async for plugin_name, events in iter_plugin_events(query):
+        events_by_plugin[plugin_name] = events
+    # Registry order, so results do not depend on which plugin finished first
+    parts = tuple(events_by_plugin[name] for name in registry if name in events_by_plugin)
+
+    normalized = (query or "").strip().lower()
+    cached = _search_results.get(normalized)
+    if (
+        cached is not None
+        and len(cached[0]) == len(parts)
+        and all(old is new for old, new in zip(cached[0], parts))
+    ):
+        return cached[2], cached[1]
+
+    # Collect all events keyed by ID (first occurrence wins)
+    events_by_id: dict[str, Event] = {}
+    for events in parts:
+        for event in events:
+            events_by_id.setdefault(event.id, event)
+    merged = sorted(events_by_id.values(), key=lambda event: event.date)
+
+    tool_result = format_events_for_tool_response(merged)
+    _search_results.pop(normalized, None)
+    _search_results[normalized] = (parts, merged, tool_result)
+    if len(_search_results) > MAX_TRACKED_QUERIES:
+        # Drop the least recently rebuilt query
+        del _search_results[next(iter(_search_results))]
+    return tool_result, merged
+
+
+async def scrape_all_plugins(query: str | None = None) -> list[Event]:
+    """Scrape events from all loaded plugins concurrently.
+
+    Args:
+        query: Optional search query to pass to plugins that support searching.
+
+    Returns:
+        Combined list of events from all plugins, deduplicated by ID and
+        sorted by date.
+    """
+    _, events = await search_events(query)
+    return events
+
+
+def _record_query(query: str | None) -> None:
+    """Count a user query so the prefetcher can keep popular ones warm."""
+    normalized = (query or "").strip().lower()
+    if not normalized:
+        return
+    _query_counts[normalized] += 1
+    if len(_query_counts) > MAX_TRACKED_QUERIES:
+        # Keep the most popular half so the counter stays bounded
+        top = _query_counts.most_common(MAX_TRACKED_QUERIES // 2)
+        _query_counts.clear()
+        _query_counts.update(dict(top))
+
+
+async def prefetch_popular_queries() -> None:
+    """Keep the scrape cache warm for the most common queries.
+
+    Runs until cancelled. The first pass runs immediately, so the browser
+    and the unfiltered scrape are warm before the first user request.
+    """
+    while True:
+        queries: list[str | None] = [None]
+        queries.extend(query for query, _ in _query_counts.most_common(PREFETCH_TOP_QUERIES))
+        for query in queries:
+            try:
+                async for _ in iter_plugin_events(query, prefetch=True):
+                    pass
+            except Exception as e:
+                logger.error(f"Error prefetching events for {query!r}: {e}")
+        await asyncio.sleep(PREFETCH_INTERVAL)
 
 
 def extract_domain_name(url: str) -> str:
@@ -69,28 +385,26 @@ def extract_domain_name(url: str) -> str:
     domain = parsed.netloc or parsed.path.split("/")[0]
     if domain.startswith("www."):
         domain = domain[4:]
-    clean_name = re.sub(r"[.\-]", "_", domain)
-    clean_name = re.sub(r"[^a-z0-9_]", "", clean_name.lower())
-    return clean_name
+    clean_name = domain.lower().translate(DOMAIN_SEPARATORS)
+    return "".join(char for char in clean_name if char in DOMAIN_NAME_CHARS)
 
 
 async def crawl_url_for_structure(url: str) -> str:
     """Crawl a URL to get its page structure for plugin generation.
 
-    Uses networkidle to wait for JavaScript content to load.
+    Uses networkidle to wait for JavaScript content to load, on the shared
+    crawler so no browser is launched per plugin.
     """
     config = CrawlerRunConfig(
         wait_until="networkidle",
         page_timeout=30000,
     )
-    async with AsyncWebCrawler() as crawler:
-        result = await crawler.arun(url=url, config=config)
-        return result.markdown
+    return await crawl_markdown(url, config)
 
 
-def get_plugin_template() -> str:
-    """Get the plugin template with instructions for Claude."""
-    return '''You are generating a Python scraper plugin for EventFinder.
+# Plugin template with instructions for Claude (static part of the
+# plugin generation system prompt)
+PLUGIN_TEMPLATE = '''You are generating a Python scraper plugin for EventFinder.
 
 The markdown content you receive is from a web crawler that converts HTML to markdown.
 Events typically appear in patterns like:
@@ -121,17 +435,23 @@ By Organizer
 Location Name
 ```
 
+JSON FEEDS - If the page content links to a JSON API or feed that lists its events
+(for example a URL ending in .json or containing /api/), scrape() should instead call
+`data = await self.fetch_json(feed_url)` and build events from the decoded data. This
+uses a shared HTTP client, needs no browser and avoids markdown parsing. Only use URLs
+that appear in the page content; never guess API endpoints.
+
 The plugin MUST follow this interface:
 
 ```python
 """[Domain] event scraper plugin."""
 
+import asyncio
 import logging
 import re
-import uuid
 from datetime import datetime
 
-from backend.models import Event
+from backend.models import Event, make_event_id
 from backend.plugins.base import ScraperPlugin
 
 logger = logging.getLogger(__name__)
@@ -152,7 +472,7 @@ class [Name]Plugin(ScraperPlugin):
         try:
             url = self.get_scrape_url(query)
             markdown = await self.crawl(url)
-            return self._parse_events(markdown)
+            return await asyncio.to_thread(self._parse_events, markdown)
         except Exception as e:
             logger.error(f"Error scraping events: {e}")
             return []
@@ -238,7 +558,7 @@ class [Name]Plugin(ScraperPlugin):
                     continue
 
         return Event(
-            id=str(uuid.uuid4()),
+            id=make_event_id(self.name, url, event_date),
             title=title,
             description=description,
             date=event_date,
@@ -262,18 +582,44 @@ Return ONLY the Python code, no explanations or markdown code blocks.
 '''
 
 
-async def generate_plugin_code(url: str, page_markdown: str) -> str:
-    """Generate plugin code using Claude."""
-    domain_name = extract_domain_name(url)
+# Plugin template as a system block marked for prompt caching
+PLUGIN_TEMPLATE_BLOCK = {
+    "type": "text",
+    "text": PLUGIN_TEMPLATE,
+    "cache_control": {"type": "ephemeral"},
+}
+
+
+def get_plugin_template() -> str:
+    """Get the plugin template with instructions for Claude."""
+    return PLUGIN_TEMPLATE
+
+
+async def generate_plugin_code(url: str, page_markdown: str, domain_name: str | None = None) -> str:
+    """Generate plugin code using Claude.
+
+    Args:
+        url: The page the plugin scrapes.
+        page_markdown: Crawled markdown of the page.
+        domain_name: Plugin filename stem, if the caller already derived it
+            from the URL.
+    """
+    if domain_name is None:
+        domain_name = extract_domain_name(url)
     plugin_name = "".join(word.capitalize() for word in domain_name.split("_"))
 
-    template = get_plugin_template()
+    # Image URLs are long and never parsed by plugins; shortening them keeps
+    # the page layout intact while fitting more events into the prompt
+    page_markdown = IMAGE_URL_RE.sub(r"\1(image)", page_markdown)
 
-    # Truncate markdown if too long
-    if len(page_markdown) > 8000:
-        page_markdown = page_markdown[:8000] + "\n... [truncated]"
+    # Truncate markdown if too long, at a line boundary
+    if len(page_markdown) > MAX_STRUCTURE_CHARS:
+        cut = page_markdown.rfind("\n", 0, MAX_STRUCTURE_CHARS)
+        page_markdown = page_markdown[:cut if cut > 0 else MAX_STRUCTURE_CHARS] + "\n... [truncated]"
 
-    system_prompt = template + f"""
+    # The template is the cached system prompt; everything specific to this
+    # URL goes in the user message so the cached prefix stays identical
+    message = f"""Generate a scraper plugin for {url}. Analyze the page structure and implement parsing logic to extract events.
 
 Generate a plugin for:
 - URL: {url}
@@ -286,37 +632,48 @@ Here is the page structure (markdown format):
 """
 
     response = await send_message(
-        message=f"Generate a scraper plugin for {url}. Analyze the page structure and implement parsing logic to extract events.",
-        system_prompt=system_prompt,
+        message=message,
+        system_prompt=[PLUGIN_TEMPLATE_BLOCK],
     )
 
-    # Clean up response
+    # Clean up response: drop a surrounding markdown code fence, if any
     code = response.strip()
-    if code.startswith("```python"):
-        code = code[9:]
-    elif code.startswith("```"):
-        code = code[3:]
-    if code.endswith("```"):
-        code = code[:-3]
+    fenced = CODE_FENCE_RE.match(code)
+    if fenced:
+        code = fenced.group(1)
 
     return code.strip()
 
 
 def save_plugin_file(domain_name: str, code: str) -> Path:
-    """Save generated plugin code to a file."""
+    """Save generated plugin code to a file.
+
+    The code is written to a temporary file and then renamed over the
+    plugin file, so a concurrent plugin reload never imports a partly
+    written module.
+    """
     plugins_dir = get_plugins_directory()
     file_path = plugins_dir / f"{domain_name}.py"
-    file_path.write_text(code)
+    # Not a .py file, so the plugin scan skips it
+    temp_path = file_path.with_suffix(".py.tmp")
+    temp_path.write_text(code)
+    temp_path.replace(file_path)
     return file_path
 
 
-async def test_generated_plugin(file_path: Path) -> tuple[bool, str]:
-    """Test a generated plugin by loading and running it."""
+async def test_generated_plugin(file_path: Path) -> tuple[bool, str, int]:
+    """Test a generated plugin by loading and running it.
+
+    Returns:
+        Tuple of (whether the plugin loaded and scraped without errors,
+        message for the user, number of events the scrape found).
+    """
     try:
-        plugin_classes = load_plugin_from_file(file_path)
+        # Importing the module reads and compiles the file; keep it off the loop
+        plugin_classes = await asyncio.to_thread(load_plugin_from_file, file_path)
 
         if not plugin_classes:
-            return False, "No valid ScraperPlugin class found in generated code."
+            return False, "No valid ScraperPlugin class found in generated code.", 0
 
         plugin_class = plugin_classes[0]
         plugin_instance = plugin_class()
@@ -324,73 +681,148 @@ async def test_generated_plugin(file_path: Path) -> tuple[bool, str]:
         logger.info(f"Testing plugin: {plugin_instance.name}")
         events = await plugin_instance.scrape()
 
-        return True, f"Plugin '{plugin_instance.name}' loaded successfully. Found {len(events)} events."
+        return True, f"Plugin '{plugin_instance.name}' loaded successfully. Found {len(events)} events.", len(events)
 
     except SyntaxError as e:
-        return False, f"Syntax error in generated code: {e}"
+        return False, f"Syntax error in generated code: {e}", 0
     except ImportError as e:
-        return False, f"Import error in generated code: {e}"
+        return False, f"Import error in generated code: {e}", 0
     except Exception as e:
-        return False, f"Error testing plugin: {e}"
+        return False, f"Error testing plugin: {e}", 0
 
 
 async def create_plugin_for_url(url: str) -> str:
-    """Create a new plugin for the given URL."""
+    """Create a new plugin for the given URL.
+
+    At most MAX_CONCURRENT_PLUGIN_CREATIONS run at once; further requests
+    wait their turn. Concurrent requests for the same URL share one run.
+    """
+    task = _inflight_plugin_creations.get(url)
+    if task is None:
+        task = asyncio.create_task(_create_plugin_for_url(url))
+        _inflight_plugin_creations[url] = task
+        task.add_done_callback(lambda _: _inflight_plugin_creations.pop(url, None))
+    return await asyncio.shield(task)
+
+
+async def _create_plugin_for_url(url: str) -> str:
+    """Crawl, generate, save and test a plugin for the given URL."""
     domain_name = extract_domain_name(url)
 
-    try:
-        logger.info(f"Crawling {url} for page structure...")
-        page_markdown = await crawl_url_for_structure(url)
+    async with _plugin_creation_semaphore:
+        try:
+            logger.info(f"Crawling {url} for page structure...")
+            page_markdown = await crawl_url_for_structure(url)
+
+            if not page_markdown:
+                return f"Failed to crawl {url}. The page might be inaccessible or empty."
+
+            # Code that already passed its test for this exact page is reused
+            markdown_hash = hashlib.sha256(page_markdown.encode()).hexdigest()
+            cached = _plugin_code_cache.get(url)
+            reused = cached is not None and cached[0] == markdown_hash
+            if reused:
+                logger.info(f"Reusing plugin code generated earlier for {url}")
+                plugin_code = cached[1]
+            else:
+                logger.info("Generating plugin code with Claude...")
+                plugin_code = await generate_plugin_code(url, page_markdown, domain_name)
+
+            logger.info(f"Saving plugin to {domain_name}.py...")
+            file_path = await asyncio.to_thread(save_plugin_file, domain_name, plugin_code)
+
+            if reused:
+                # Reused code already found events in a live scrape, so only
+                # check that the saved file still loads and defines a plugin
+                plugin_classes = await asyncio.to_thread(load_plugin_from_file, file_path)
+                if plugin_classes:
+                    success, test_message = True, "Reused plugin code that was already tested for this page."
+                else:
+                    # Regenerate next time instead of reusing the same code
+                    _plugin_code_cache.pop(url, None)
+                    success, test_message = False, "No valid ScraperPlugin class found in generated code."
+            else:
+                logger.info("Testing generated plugin...")
+                success, test_message, event_count = await test_generated_plugin(file_path)
+                # Code that found no events may be wrong for this page, so
+                # asking again generates new code instead of reusing it
+                if success and event_count:
+                    _plugin_code_cache[url] = (markdown_hash, plugin_code)
+                else:
+                    _plugin_code_cache.pop(url, None)
+
+            if success:
+                module_name = f"backend.plugins.{domain_name}"
+                replaced = [
+                    plugin_class.name
+                    for plugin_class in get_plugin_registry().values()
+                    if plugin_class.__module__ == module_name
+                ]
+                registry = await asyncio.to_thread(reload_plugins)
+                # Reloading re-imports the new plugin file; build its instance
+                refresh_plugin_instances()
+                # Results scraped by the previous code for this file are stale
+                for plugin_name in replaced + [
+                    plugin_class.name
+                    for plugin_class in registry.values()
+                    if plugin_class.__module__ == module_name
+                ]:
+                    _forget_plugin_results(plugin_name)
+                return f"Successfully created plugin for {url}!\n\n{test_message}\n\nThe plugin has been saved to `{file_path.name}` and is now ready to use."
+            else:
+                return f"Plugin generated but there was an error during testing:\n\n{test_message}\n\nThe plugin file has been saved to `{file_path.name}`. You may need to manually fix it or try again."
+
+        except Exception as e:
+            logger.error(f"Error creating plugin for {url}: {e}")
+            return f"Failed to create plugin for {url}: {e}"
 
-        if not page_markdown:
-            return f"Failed to crawl {url}. The page might be inaccessible or empty."
 
-        logger.info("Generating plugin code with Claude...")
-        plugin_code = await generate_plugin_code(url, page_markdown)
+def get_or_create_conversation(conversation_id: str | None) -> tuple[str, list[dict[str, Any]]]:
+    """Get an existing conversation or create a new one.
 
-        logger.info(f"Saving plugin to {domain_name}.py...")
-        file_path = save_plugin_file(domain_name, plugin_code)
+    Expired conversations are treated as unknown, so the client starts over
+    with a new conversation_id.
+    """
+    now = time.monotonic()
+    if conversation_id:
+        entry = _conversations.get(conversation_id)
+        if entry is not None and now - entry[0] < CONVERSATION_TTL:
+            _conversations[conversation_id] = (now, entry[1])
+            _conversations.move_to_end(conversation_id)
+            return conversation_id, entry[1]
 
-        logger.info("Testing generated plugin...")
-        success, test_message = await test_generated_plugin(file_path)
+    new_id = str(uuid.uuid4())
+    messages: list[dict[str, Any]] = []
+    _conversations[new_id] = (now, messages)
+    _prune_conversations(now)
+    return new_id, messages
 
-        if success:
-            reload_plugins()
-            return f"Successfully created plugin for {url}!\n\n{test_message}\n\nThe plugin has been saved to `{file_path.name}` and is now ready to use."
-        else:
-            return f"Plugin generated but there was an error during testing:\n\n{test_message}\n\nThe plugin file has been saved to `{file_path.name}`. You may need to manually fix it or try again."
 
-    except Exception as e:
-        logger.error(f"Error creating plugin for {url}: {e}")
-        return f"Failed to create plugin for {url}: {e}"
+def _remember_turn(messages: list[dict[str, Any]], message: str, response: str) -> None:
+    """Append a user/assistant exchange to a stored conversation.
 
+    Only the newest MAX_STORED_MESSAGES are kept; older turns could never
+    be sent to Claude again anyway.
+    """
+    messages.append({"role": "user", "content": message})
+    messages.append({"role": "assistant", "content": response})
+    if len(messages) > MAX_STORED_MESSAGES:
+        del messages[:-MAX_STORED_MESSAGES]
 
-def get_or_create_conversation(conversation_id: str | None) -> tuple[str, list[dict[str, Any]]]:
-    """Get an existing conversation or create a new one."""
-    if conversation_id and conversation_id in _conversations:
-        return conversation_id, _conversations[conversation_id]
 
-    new_id = str(uuid.uuid4())
-    _conversations[new_id] = []
-    return new_id, _conversations[new_id]
+def _prune_conversations(now: float) -> None:
+    """Drop expired conversations and the least recently used beyond the cap."""
+    while _conversations:
+        oldest_id, (last_used, _) = next(iter(_conversations.items()))
+        if len(_conversations) <= MAX_CONVERSATIONS and now - last_used < CONVERSATION_TTL:
+            break
+        _conversations.popitem(last=False)
+        clear_cached_responses(oldest_id)
 
 
 def events_to_response_format(events: list[Event]) -> list[dict[str, Any]]:
     """Convert Event objects to API response format."""
-    return [
-        {
-            "id": event.id,
-            "title": event.title,
-            "description": event.description,
-            "date": event.date.isoformat(),
-            "time": event.time,
-            "location": event.location,
-            "url": event.url,
-            "source": event.source,
-            "tags": event.tags,
-        }
-        for event in events
-    ]
+    return [event.response_data for event in events]
 
 
 async def process_chat_message(
@@ -400,42 +832,114 @@ async def process_chat_message(
     """Process a chat message and return AI response.
 
     Uses Claude's tool calling to intelligently decide when to search for
-    events or create plugins based on the user's message.
+    events or create plugins based on the user's message. Collects the
+    output of stream_chat_message, so history and the response cache are
+    handled in one place.
+    """
+    conv_id = ""
+    chunks: list[str] = []
+    events: list[dict[str, Any]] = []
+    async for kind, value in stream_chat_message(message, conversation_id):
+        if kind == "conversation":
+            conv_id = value
+        elif kind == "text":
+            chunks.append(value)
+        elif kind == "tool_use":
+            # Only the text after the last tool round is the answer
+            chunks.clear()
+        elif kind == "events":
+            events = value
+
+    return {
+        "response": "".join(chunks),
+        "conversation_id": conv_id,
+        "events": events,
+    }
+
+
+def _previous_reply(messages: list[dict[str, Any]]) -> str:
+    """Get the last assistant reply in a history, or "" if there is none."""
+    if messages and messages[-1]["role"] == "assistant":
+        return messages[-1]["content"]
+    return ""
+
+
+async def stream_chat_message(
+    message: str,
+    conversation_id: str | None = None,
+) -> AsyncIterator[tuple[str, Any]]:
+    """Process a chat message, streaming the AI response as it is generated.
+
+    A near-identical message following the same assistant reply, or
+    repeating the message that was just answered, is answered from the
+    response cache. Turns that called a tool with side effects are never
+    cached, so repeating them runs the tool again.
+
+    Args:
+        message: The user's message.
+        conversation_id: Optional existing conversation ID.
+
+    Yields:
+        ("conversation", conversation ID) first, then ("text", chunk) and
+        ("tool_use", tool names) items as produced by stream_chat_with_tools,
+        and finally ("events", events in API response format).
     """
     conv_id, messages = get_or_create_conversation(conversation_id)
+    yield "conversation", conv_id
 
     logger.info(f"Processing message for conversation {conv_id}")
     logger.info(f"Existing history: {len(messages)} messages")
 
+    context = _previous_reply(messages)
+    cached = get_cached_response(conv_id, message, context)
+    if cached is not None:
+        _remember_turn(messages, message, cached["response"])
+        yield "text", cached["response"]
+        yield "events", cached["events"]
+        return
+
     # Use tool-based chat - Claude decides when to use tools
-    response, events = await chat_with_tools(
+    chunks: list[str] = []
+    events: list[dict[str, Any]] = []
+    cacheable = True
+    async for kind, value in stream_chat_with_tools(
         message=message,
         conversation_history=messages if messages else None,
-        scrape_function=scrape_all_plugins,
+        search_function=search_events,
         create_plugin_function=create_plugin_for_url,
-    )
+    ):
+        if kind == "text":
+            chunks.append(value)
+        elif kind == "tool_use":
+            # Only the text after the last tool round is the answer
+            chunks.clear()
+            if not READ_ONLY_TOOLS.issuperset(value):
+                cacheable = False
+        elif kind == "events":
+            events = events_to_response_format(value)
+            value = events
+        yield kind, value
 
     # Store conversation history (simplified - just text for now)
-    messages.append({"role": "user", "content": message})
-    messages.append({"role": "assistant", "content": response})
-
+    response = "".join(chunks)
+    _remember_turn(messages, message, response)
     logger.info(f"Updated history: {len(messages)} messages")
 
-    return {
-        "response": response,
-        "conversation_id": conv_id,
-        "events": events_to_response_format(events),
-    }
+    if cacheable:
+        cache_response(conv_id, message, {
+            "response": response,
+            "conversation_id": conv_id,
+            "events": events,
+        }, context)
 
 
 def get_conversation(conversation_id: str) -> list[dict[str, Any]] | None:
     """Get a conversation by ID."""
-    return _conversations.get(conversation_id)
+    entry = _conversations.get(conversation_id)
+    return entry[1] if entry is not None else None
 
 
 def clear_conversation(conversation_id: str) -> bool:
     """Clear a conversation by ID."""
-    if conversation_id in _conversations:
-        del _conversations[conversation_id]
-        return True
-    return False
+    clear_cached_responses(conversation_id)
+    return _conversations.pop(conversation_id, None) is not None
@@ -0,0 +1,82 @@
+"""Shared crawl4ai crawler for scraper plugins and plugin generation."""
+
+import asyncio
+import logging
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CrawlResult
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of pages rendered concurrently by the shared browser
+MAX_CONCURRENT_CRAWLS = 10
+
+# Application-lifetime crawler (one Playwright browser for the whole process)
+_crawler: AsyncWebCrawler | None = None
+_crawler_lock = asyncio.Lock()
+_crawl_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CRAWLS)
+
+
+async def start_crawler() -> AsyncWebCrawler:
+    """Start the shared crawler if it is not running yet.
+
+    Returns:
+        The running AsyncWebCrawler instance.
+    """
+    global _crawler
+    async with _crawler_lock:
+        if _crawler is None:
+            crawler = AsyncWebCrawler(verbose=False)
+            await crawler.__aenter__()
+            _crawler = crawler
+            logger.info("Started shared web crawler")
+    return _crawler
+
+
+async def close_crawler() -> None:
+    """Shut down the shared crawler and its browser."""
+    global _crawler
+    async with _crawler_lock:
+        if _crawler is not None:
+            await _crawler.__aexit__(None, None, None)
+            _crawler = None
+            logger.info("Closed shared web crawler")
+
+
+async def get_crawler() -> AsyncWebCrawler:
+    """Get the shared crawler, starting it lazily if needed.
+
+    Returns:
+        The running AsyncWebCrawler instance.
+    """
+    if _crawler is not None:
+        return _crawler
+    return await start_crawler()
+
+
+async def crawl_page(url: str, config: CrawlerRunConfig) -> CrawlResult:
+    """Crawl a URL with the shared crawler.
+
+    Args:
+        url: The URL to crawl.
+        config: Run configuration for this crawl.
+
+    Returns:
+        The full crawl result.
+    """
+    crawler = await get_crawler()
+    async with _crawl_semaphore:
+        return await crawler.arun(url=url, config=config)
+
+
+async def crawl_markdown(url: str, config: CrawlerRunConfig) -> str:
+    """Crawl a URL with the shared crawler and return its markdown.
+
+    Args:
+        url: The URL to crawl.
+        config: Run configuration for this crawl.
+
+    Returns:
+        Markdown representation of the page content.
+    """
+    result = await crawl_page(url, config)
+    return result.markdown
@@ -0,0 +1,58 @@
+"""Shared HTTP client for direct (non-browser) fetches."""
+
+import asyncio
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Request timeout for direct fetches (seconds)
+HTTP_TIMEOUT = 10.0
+
+# Connection pool bounds; keep-alive connections are reused across requests
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+
+# Application-lifetime client (one connection pool for the whole process)
+_http_client: httpx.AsyncClient | None = None
+_http_client_lock = asyncio.Lock()
+
+
+async def start_http_client() -> httpx.AsyncClient:
+    """Create the shared HTTP client if it does not exist yet.
+
+    Returns:
+        The shared AsyncClient instance.
+    """
+    global _http_client
+    async with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.AsyncClient(
+                http2=True,
+                timeout=HTTP_TIMEOUT,
+                limits=HTTP_LIMITS,
+                follow_redirects=True,
+            )
+            logger.info("Started shared HTTP client")
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _http_client
+    async with _http_client_lock:
+        if _http_client is not None:
+            await _http_client.aclose()
+            _http_client = None
+            logger.info("Closed shared HTTP client")
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it lazily if needed.
+
+    Returns:
+        The shared AsyncClient instance.
+    """
+    if _http_client is not None:
+        return _http_client
+    return await start_http_client()
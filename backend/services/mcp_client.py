@@ -1,7 +1,9 @@
 """MCP client for Cronty notification scheduling."""
 
+import asyncio
 import logging
 import os
+from contextlib import suppress
 from typing import Any
 
 from fastmcp import Client
@@ -12,6 +14,10 @@ logger = logging.getLogger(__name__)
 # Notification topic for this app
 NOTIFICATION_TOPIC = "maks-aws-hackday"
 
+# Connected client shared by all notification calls (one MCP session per process)
+_mcp_client: Client | None = None
+_mcp_client_lock = asyncio.Lock()
+
 
 def get_mcp_client() -> Client:
     """Create an MCP client with bearer token authentication."""
@@ -30,6 +36,54 @@ def get_mcp_client() -> Client:
     return Client(transport)
 
 
+def _result_payload(result: Any) -> Any:
+    """Get the JSON-friendly payload of an MCP tool result.
+
+    Structured results are returned as-is; results without structured
+    content (or from older clients without .data) fall back to their text.
+    """
+    data = getattr(result, "data", None)
+    if data is not None:
+        return data
+    return str(result)
+
+
+async def get_shared_mcp_client() -> Client:
+    """Get the shared, connected MCP client.
+
+    The session is opened on first use and kept for the process lifetime,
+    so notifications skip the connection and MCP handshake. A dropped
+    session is replaced on the next call.
+
+    Returns:
+        The connected Client instance.
+    """
+    global _mcp_client
+    if _mcp_client is not None and _mcp_client.is_connected():
+        return _mcp_client
+    async with _mcp_client_lock:
+        if _mcp_client is None or not _mcp_client.is_connected():
+            if _mcp_client is not None:
+                with suppress(Exception):
+                    await _mcp_client.__aexit__(None, None, None)
+                _mcp_client = None
+            client = get_mcp_client()
+            await client.__aenter__()
+            _mcp_client = client
+            logger.info("Connected shared MCP client")
+    return _mcp_client
+
+
+async def close_mcp_client() -> None:
+    """Close the shared MCP client session, if one was opened."""
+    global _mcp_client
+    async with _mcp_client_lock:
+        if _mcp_client is not None:
+            await _mcp_client.__aexit__(None, None, None)
+            _mcp_client = None
+            logger.info("Closed shared MCP client")
+
+
 async def schedule_event_notification(
     event_title: str,
     event_time: str,
@@ -48,18 +102,17 @@ async def schedule_event_notification(
     message = f"🎉 Starting now: {event_title}\n⏰ {event_time}"
 
     try:
-        client = get_mcp_client()
-        async with client:
-            result = await client.call_tool(
-                "schedule_notification",
-                {
-                    "message": message,
-                    "notification_topic": NOTIFICATION_TOPIC,
-                    "delay": delay,
-                },
-            )
-            logger.info(f"Scheduled notification: {result}")
-            return {"success": True, "result": result.data if hasattr(result, 'data') else str(result)}
+        client = await get_shared_mcp_client()
+        result = await client.call_tool(
+            "schedule_notification",
+            {
+                "message": message,
+                "notification_topic": NOTIFICATION_TOPIC,
+                "delay": delay,
+            },
+        )
+        logger.info(f"Scheduled notification: {result}")
+        return {"success": True, "result": _result_payload(result)}
     except Exception as e:
         logger.error(f"Failed to schedule notification: {e}")
         return {"success": False, "error": str(e)}
@@ -79,18 +132,17 @@ async def send_immediate_notification(
         Result from the MCP tool call.
     """
     try:
-        client = get_mcp_client()
-        async with client:
-            params: dict[str, Any] = {
-                "message": message,
-                "notification_topic": NOTIFICATION_TOPIC,
-            }
-            if title:
-                params["title"] = title
-
-            result = await client.call_tool("send_push_notification", params)
-            logger.info(f"Sent notification: {result}")
-            return {"success": True, "result": result.data if hasattr(result, 'data') else str(result)}
+        client = await get_shared_mcp_client()
+        params: dict[str, Any] = {
+            "message": message,
+            "notification_topic": NOTIFICATION_TOPIC,
+        }
+        if title:
+            params["title"] = title
+
+        result = await client.call_tool("send_push_notification", params)
+        logger.info(f"Sent notification: {result}")
+        return {"success": True, "result": _result_payload(result)}
     except Exception as e:
         logger.error(f"Failed to send notification: {e}")
         return {"success": False, "error": str(e)}
@@ -114,20 +166,19 @@ async def schedule_notification_at_time(
         Result from the MCP tool call.
     """
     try:
-        client = get_mcp_client()
-        async with client:
-            result = await client.call_tool(
-                "schedule_notification",
-                {
-                    "message": message,
-                    "notification_topic": NOTIFICATION_TOPIC,
-                    "date": date,
-                    "time": time,
-                    "timezone": timezone,
-                },
-            )
-            logger.info(f"Scheduled notification: {result}")
-            return {"success": True, "result": result.data if hasattr(result, 'data') else str(result)}
+        client = await get_shared_mcp_client()
+        result = await client.call_tool(
+            "schedule_notification",
+            {
+                "message": message,
+                "notification_topic": NOTIFICATION_TOPIC,
+                "date": date,
+                "time": time,
+                "timezone": timezone,
+            },
+        )
+        logger.info(f"Scheduled notification: {result}")
+        return {"success": True, "result": _result_payload(result)}
     except Exception as e:
         logger.error(f"Failed to schedule notification: {e}")
         return {"success": False, "error": str(e)}
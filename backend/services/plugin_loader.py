@@ -2,7 +2,10 @@
 
 import importlib
 import importlib.util
+import json
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Type
 
@@ -10,9 +13,25 @@ from backend.plugins.base import ScraperPlugin
 
 logger = logging.getLogger(__name__)
 
-# Registry to store loaded plugin classes
+# Files in the plugins directory that are not plugins
+NON_PLUGIN_FILES = frozenset({"__init__.py", "base.py"})
+
+# Registry to store loaded plugin classes. Replaced, never mutated, on
+# reload, so readers iterating an older registry are unaffected.
 _plugin_registry: dict[str, Type[ScraperPlugin]] = {}
 
+# Serializes loads, which run in worker threads
+_plugin_load_lock = threading.Lock()
+
+# Classes loaded from each plugin file, and the (mtime_ns, size) they were
+# loaded at; unchanged files are not re-imported on reload
+_plugin_file_classes: dict[Path, list[Type[ScraperPlugin]]] = {}
+_plugin_file_stats: dict[Path, tuple[int, int]] = {}
+
+# Plugin info snapshot (and its JSON encoding), rebuilt whenever plugins load
+_plugin_info: tuple[dict[str, str], ...] = ()
+_plugin_info_json: bytes = b"[]"
+
 
 def get_plugins_directory() -> Path:
     """Get the path to the plugins directory.
@@ -36,11 +55,12 @@ def scan_plugin_files() -> list[Path]:
         logger.warning(f"Plugins directory not found: {plugins_dir}")
         return plugin_files
 
-    for file_path in plugins_dir.glob("*.py"):
-        # Exclude __init__.py and base.py
-        if file_path.name in ("__init__.py", "base.py"):
-            continue
-        plugin_files.append(file_path)
+    # One directory read; Path objects are only built for plugin files
+    with os.scandir(plugins_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".py") and name not in NON_PLUGIN_FILES and entry.is_file():
+                plugin_files.append(Path(entry.path))
 
     return plugin_files
 
@@ -70,13 +90,15 @@ def load_plugin_from_file(file_path: Path) -> list[Type[ScraperPlugin]]:
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
 
-        # Find all ScraperPlugin subclasses in the module
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
+        # Find all ScraperPlugin subclasses defined in the module, in
+        # definition order; the namespace dict avoids a sorted dir() and
+        # getattr per name. Classes imported from elsewhere (the base class,
+        # another plugin) are skipped.
+        for attr in vars(module).values():
             if (
                 isinstance(attr, type)
+                and attr.__module__ == module_name
                 and issubclass(attr, ScraperPlugin)
-                and attr is not ScraperPlugin
             ):
                 plugins.append(attr)
                 logger.info(f"Loaded plugin: {attr.name} from {file_path.name}")
@@ -90,27 +112,58 @@ def load_plugin_from_file(file_path: Path) -> list[Type[ScraperPlugin]]:
 def load_all_plugins() -> dict[str, Type[ScraperPlugin]]:
     """Load all plugins from the plugins directory.
 
+    Files whose modification time and size are unchanged since they were
+    last loaded keep their existing classes instead of being re-imported.
+
+    Loads may run in worker threads while the event loop reads the
+    registry, so each load builds a new registry and publishes it in one
+    assignment; concurrent loads are serialized.
+
     Returns:
         Dictionary mapping plugin names to plugin classes.
     """
-    global _plugin_registry
-    _plugin_registry.clear()
-
-    plugin_files = scan_plugin_files()
-
-    for file_path in plugin_files:
-        plugin_classes = load_plugin_from_file(file_path)
-        for plugin_class in plugin_classes:
-            _plugin_registry[plugin_class.name] = plugin_class
-
-    logger.info(f"Loaded {len(_plugin_registry)} plugins: {list(_plugin_registry.keys())}")
-    return _plugin_registry
+    global _plugin_registry, _plugin_info, _plugin_info_json
+    with _plugin_load_lock:
+        registry: dict[str, Type[ScraperPlugin]] = {}
+        plugin_files = scan_plugin_files()
+
+        # Forget files that were removed since the last load
+        for file_path in _plugin_file_classes.keys() - set(plugin_files):
+            del _plugin_file_classes[file_path]
+            del _plugin_file_stats[file_path]
+
+        for file_path in plugin_files:
+            stat = file_path.stat()
+            file_stats = (stat.st_mtime_ns, stat.st_size)
+            plugin_classes = _plugin_file_classes.get(file_path)
+            if plugin_classes is None or _plugin_file_stats[file_path] != file_stats:
+                plugin_classes = load_plugin_from_file(file_path)
+                _plugin_file_classes[file_path] = plugin_classes
+                _plugin_file_stats[file_path] = file_stats
+            for plugin_class in plugin_classes:
+                registry[plugin_class.name] = plugin_class
+
+        plugin_info = tuple(
+            {
+                "name": plugin_class.name,
+                "source_url": plugin_class.source_url,
+                "description": plugin_class.description,
+            }
+            for plugin_class in registry.values()
+        )
+        _plugin_registry = registry
+        _plugin_info = plugin_info
+        _plugin_info_json = json.dumps(plugin_info).encode()
+
+    logger.info(f"Loaded {len(registry)} plugins: {list(registry.keys())}")
+    return registry
 
 
 def reload_plugins() -> dict[str, Type[ScraperPlugin]]:
     """Reload all plugins from the plugins directory.
 
-    This clears the existing registry and reloads all plugins.
+    This builds a new registry and swaps it in; only new or changed plugin
+    files are re-imported.
 
     Returns:
         Dictionary mapping plugin names to plugin classes.
@@ -127,17 +180,19 @@ def get_plugin_registry() -> dict[str, Type[ScraperPlugin]]:
     return _plugin_registry
 
 
-def get_plugin_info() -> list[dict[str, str]]:
+def get_plugin_info() -> tuple[dict[str, str], ...]:
     """Get information about all loaded plugins.
 
     Returns:
-        List of dictionaries with plugin name, source_url, and description.
+        Tuple of dictionaries with plugin name, source_url, and description.
+    """
+    return _plugin_info
+
+
+def get_plugin_info_json() -> bytes:
+    """Get the plugin information pre-encoded as JSON.
+
+    Returns:
+        UTF-8 JSON array of plugin name, source_url, and description.
     """
-    return [
-        {
-            "name": plugin_class.name,
-            "source_url": plugin_class.source_url,
-            "description": plugin_class.description,
-        }
-        for plugin_class in _plugin_registry.values()
-    ]
+    return _plugin_info_json
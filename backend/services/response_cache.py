@@ -0,0 +1,139 @@
+"""Response cache for repeated chat messages within a conversation."""
+
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# How long a cached response stays valid (seconds)
+RESPONSE_CACHE_TTL = 300.0
+
+# Minimum token-set similarity for a message to count as a repeat
+SIMILARITY_THRESHOLD = 0.9
+
+# Messages with fewer words than this ("yes", "more", "why?") depend on
+# context too much to be answered from the cache
+MIN_CACHED_WORDS = 3
+
+# Bounds on cache size
+MAX_CACHED_CONVERSATIONS = 1000
+MAX_ENTRIES_PER_CONVERSATION = 32
+
+TOKEN_RE = re.compile(r"\w+")
+
+# conversation_id -> list of (timestamp, hashes of the contexts the entry
+# answers, message tokens, response)
+_response_cache: OrderedDict[
+    str, list[tuple[float, frozenset[int], frozenset[str], dict[str, Any]]]
+] = OrderedDict()
+
+
+def _tokenize(message: str) -> frozenset[str] | None:
+    """Normalize a message into lowercase words and adjacent word pairs.
+
+    The word pairs make word order count towards similarity.
+
+    Returns:
+        The token set, or None if the message is too short to cache.
+    """
+    words = TOKEN_RE.findall(message.lower())
+    if len(words) < MIN_CACHED_WORDS:
+        return None
+    return frozenset(words).union(f"{a} {b}" for a, b in zip(words, words[1:]))
+
+
+def _similarity(a: frozenset[str], b: frozenset[str]) -> float:
+    """Jaccard similarity between two token sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def get_cached_response(
+    conversation_id: str,
+    message: str,
+    context: str = "",
+) -> dict[str, Any] | None:
+    """Look up a cached response for a near-identical message.
+
+    Only entries from the same conversation that answer the given context
+    are considered, so responses never leak between users and follow-ups
+    are not answered with a reply to a different question.
+
+    Args:
+        conversation_id: Conversation the message belongs to.
+        message: The user's message.
+        context: What the message follows, e.g. the previous assistant reply.
+
+    Returns:
+        The cached response dictionary, or None on a miss.
+    """
+    entries = _response_cache.get(conversation_id)
+    if not entries:
+        return None
+    tokens = _tokenize(message)
+    if tokens is None:
+        return None
+
+    now = time.monotonic()
+    context_hash = hash(context)
+    best_response = None
+    best_score = SIMILARITY_THRESHOLD
+    for timestamp, cached_contexts, cached_tokens, response in entries:
+        if now - timestamp > RESPONSE_CACHE_TTL or context_hash not in cached_contexts:
+            continue
+        score = _similarity(tokens, cached_tokens)
+        if score >= best_score:
+            best_score = score
+            best_response = response
+
+    if best_response is not None:
+        _response_cache.move_to_end(conversation_id)
+        logger.info(f"Response cache hit for conversation {conversation_id} (similarity {best_score:.2f})")
+    return best_response
+
+
+def cache_response(
+    conversation_id: str,
+    message: str,
+    response: dict[str, Any],
+    context: str = "",
+) -> None:
+    """Store a response for later near-duplicate lookups.
+
+    The entry answers the message when it follows the same context again,
+    and also right after the response itself, so repeating the message that
+    was just answered is a hit. Messages too short to be matched reliably
+    are not stored.
+
+    Args:
+        conversation_id: Conversation the message belongs to.
+        message: The user's message.
+        response: Response dictionary returned to the client.
+        context: What the message follows, e.g. the previous assistant reply.
+    """
+    tokens = _tokenize(message)
+    if tokens is None:
+        return
+
+    now = time.monotonic()
+    entries = [
+        entry
+        for entry in _response_cache.get(conversation_id, [])
+        if now - entry[0] <= RESPONSE_CACHE_TTL
+    ]
+    contexts = frozenset((hash(context), hash(response["response"])))
+    entries.append((now, contexts, tokens, response))
+    _response_cache[conversation_id] = entries[-MAX_ENTRIES_PER_CONVERSATION:]
+    _response_cache.move_to_end(conversation_id)
+
+    while len(_response_cache) > MAX_CACHED_CONVERSATIONS:
+        _response_cache.popitem(last=False)
+
+
+def clear_cached_responses(conversation_id: str) -> None:
+    """Drop all cached responses for a conversation."""
+    _response_cache.pop(conversation_id, None)
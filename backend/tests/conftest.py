@@ -0,0 +1,33 @@
+"""Shared pytest fixtures."""
+
+from datetime import datetime
+
+import pytest
+
+from backend.plugins import cerebralvalley_ai, luma
+
+# Reference time for parser tests: Thursday, Jan 29 2026, 9:00 AM
+FIXED_NOW = datetime(2026, 1, 29, 9, 0)
+
+
+class FixedDatetime(datetime):
+    """datetime whose now() always returns FIXED_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(
+            FIXED_NOW.year,
+            FIXED_NOW.month,
+            FIXED_NOW.day,
+            FIXED_NOW.hour,
+            FIXED_NOW.minute,
+            tzinfo=tz,
+        )
+
+
+@pytest.fixture
+def fixed_now(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    """Freeze the current time seen by the plugin parsers."""
+    monkeypatch.setattr(luma, "datetime", FixedDatetime)
+    monkeypatch.setattr(cerebralvalley_ai, "datetime", FixedDatetime)
+    return FIXED_NOW
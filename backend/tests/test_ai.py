@@ -0,0 +1,267 @@
+"""Tests for the AI service: history handling and the tool-calling loop."""
+
+import asyncio
+import copy
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from backend.models import Event
+from backend.services import ai
+from backend.services.ai import _truncate_history
+
+
+def _user(text):
+    return {"role": "user", "content": text}
+
+
+def _assistant(text):
+    return {"role": "assistant", "content": text}
+
+
+def _tool_use(tool_id):
+    return {
+        "role": "assistant",
+        "content": [{"type": "tool_use", "id": tool_id, "name": "search_events", "input": {}}],
+    }
+
+
+def _tool_result(tool_id):
+    return {
+        "role": "user",
+        "content": [{"type": "tool_result", "tool_use_id": tool_id, "content": "[]"}],
+    }
+
+
+def test_short_history_is_kept_whole():
+    history = [_user("hi"), _assistant("hello"), _user("events?"), _assistant("sure")]
+
+    assert _truncate_history(history) == history
+
+
+def test_keeps_newest_messages_within_message_cap():
+    history = []
+    for turn in range(10):
+        history += [_user(f"q{turn}"), _assistant(f"a{turn}")]
+
+    kept = _truncate_history(history, max_messages=4)
+
+    assert kept == history[-4:]
+
+
+def test_keeps_newest_messages_within_token_cap():
+    history = [_user("x" * 400), _assistant("y" * 400), _user("short"), _assistant("reply")]
+
+    kept = _truncate_history(history, max_tokens=150)
+
+    assert kept == history[2:]
+
+
+def test_never_starts_with_assistant_message():
+    history = [_user("q0"), _assistant("a0"), _user("q1"), _assistant("a1")]
+
+    kept = _truncate_history(history, max_messages=3)
+
+    assert kept == history[2:]
+
+
+def test_never_splits_tool_use_from_tool_result():
+    history = [
+        _user("find events"),
+        _tool_use("t1"),
+        _tool_result("t1"),
+        _assistant("here they are"),
+        _user("thanks"),
+        _assistant("welcome"),
+    ]
+
+    # A cut at four messages would start at the tool_use/tool_result pair
+    kept = _truncate_history(history, max_messages=5)
+
+    assert kept == history[4:]
+    assert kept[0]["role"] == "user"
+
+
+def test_empty_history():
+    assert _truncate_history([]) == []
+
+
+def text_block(text):
+    return SimpleNamespace(type="text", text=text)
+
+
+def tool_block(tool_id, name, tool_input):
+    return SimpleNamespace(type="tool_use", id=tool_id, name=name, input=tool_input)
+
+
+def response(*content, stop_reason="end_turn"):
+    usage = SimpleNamespace(
+        input_tokens=1,
+        output_tokens=1,
+        cache_read_input_tokens=0,
+        cache_creation_input_tokens=0,
+    )
+    return SimpleNamespace(content=list(content), stop_reason=stop_reason, usage=usage)
+
+
+class FakeStream:
+    """Stands in for the SDK's message stream context manager."""
+
+    def __init__(self, message):
+        self.message = message
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def __aiter__(self):
+        for block in self.message.content:
+            if block.type == "text":
+                yield SimpleNamespace(type="text", text=block.text)
+
+    async def get_final_message(self):
+        return self.message
+
+
+class FakeClient:
+    """Stands in for AsyncAnthropic, replying with canned responses in order."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.messages = self
+
+    def stream(self, **kwargs):
+        self.requests.append(copy.deepcopy(kwargs["messages"]))
+        return FakeStream(self.responses.pop(0))
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """Install a FakeClient; call it with the responses to send."""
+
+    def install(*responses):
+        client = FakeClient(*responses)
+        monkeypatch.setattr(ai, "_client", client)
+        return client
+
+    return install
+
+
+def _chat(message, search_function=None):
+    return asyncio.run(ai.chat_with_tools(message, [], search_function, None))
+
+
+def test_failed_tool_is_reported_to_claude(fake_client):
+    client = fake_client(
+        response(tool_block("t1", "search_events", {"query": "ai"}), stop_reason="tool_use"),
+        response(text_block("Search is down, sorry.")),
+    )
+
+    async def search(query):
+        raise RuntimeError("boom")
+
+    text, events = _chat("find ai events", search)
+
+    assert text == "Search is down, sorry."
+    assert events == []
+    (result,) = client.requests[1][-1]["content"]
+    assert result["tool_use_id"] == "t1"
+    assert result["is_error"] is True
+    assert "boom" in result["content"]
+
+
+def test_cancelled_tool_is_reported_to_claude(fake_client):
+    client = fake_client(
+        response(
+            tool_block("t1", "search_events", {"query": "ai"}),
+            tool_block("t2", "search_events", {"query": "music"}),
+            stop_reason="tool_use",
+        ),
+        response(text_block("Only found AI events.")),
+    )
+
+    async def search(query):
+        if query == "music":
+            raise asyncio.CancelledError()
+        return '{"events": []}', []
+
+    text, _ = _chat("find ai and music events", search)
+
+    assert text == "Only found AI events."
+    first, second = client.requests[1][-1]["content"]
+    assert first["content"] == '{"events": []}'
+    assert "is_error" not in first
+    assert second["is_error"] is True
+
+
+EVENTS = [
+    Event(
+        id=event_id,
+        title=title,
+        date=datetime(2026, 2, day),
+        url=f"https://example.com/{event_id}",
+        source="Fake",
+    )
+    for event_id, title, day in [
+        ("e1", "AI Meetup", 1),
+        ("e2", "Music Night", 2),
+        ("e3", "AI Hackathon", 3),
+    ]
+]
+
+
+async def _search_all(query):
+    return ai.format_events_for_tool_response(EVENTS), EVENTS
+
+
+def test_display_with_answer_text_ends_the_turn(fake_client):
+    client = fake_client(
+        response(tool_block("t1", "search_events", {"query": "ai"}), stop_reason="tool_use"),
+        response(
+            text_block("Here are two AI events."),
+            tool_block("t2", "display_events", {"event_ids": ["e3", "e1"]}),
+            stop_reason="tool_use",
+        ),
+    )
+
+    text, events = _chat("find ai events", _search_all)
+
+    assert len(client.requests) == 2
+    assert text == "Here are two AI events."
+    assert [event.id for event in events] == ["e3", "e1"]
+
+
+def test_display_without_answer_text_asks_claude_again(fake_client):
+    client = fake_client(
+        response(tool_block("t1", "search_events", {}), stop_reason="tool_use"),
+        response(tool_block("t2", "display_events", {"event_ids": ["e2"]}), stop_reason="tool_use"),
+        response(text_block("Music Night is on Monday.")),
+    )
+
+    text, events = _chat("anything with music?", _search_all)
+
+    assert len(client.requests) == 3
+    assert text == "Music Night is on Monday."
+    assert [event.id for event in events] == ["e2"]
+
+
+def test_display_next_to_another_tool_asks_claude_again(fake_client):
+    client = fake_client(
+        response(
+            text_block("Searching and showing what I have."),
+            tool_block("t1", "search_events", {}),
+            tool_block("t2", "display_events", {"event_ids": ["e1"]}),
+            stop_reason="tool_use",
+        ),
+        response(text_block("AI Meetup is the best match.")),
+    )
+
+    text, events = _chat("find ai events", _search_all)
+
+    assert len(client.requests) == 2
+    assert text == "AI Meetup is the best match."
+    assert [event.id for event in events] == ["e1"]
@@ -0,0 +1,70 @@
+"""Parser regression tests for the Cerebral Valley plugin."""
+
+from datetime import datetime
+
+from backend.plugins.cerebralvalley_ai import CerebralvalleyAiPlugin
+
+MARKDOWN = """# Events
+
+### [All Events](/events)
+
+Jan30
+
+### [GenAI Demo Night](/events/genai-demo-night)
+
+Fri · 5:00 PM – 9:00 PM PST
+
+Shack15, San Francisco, CA
+
+Join founders and researchers for an evening of live demos of the newest generative AI products, followed by networking and drinks with the community.
+
+### [Agents Hackathon](https://partiful.com/e/agents)
+
+Fri · 6:00 PM
+
+Feb2
+
+### [LLM Paper Club](events/paper-club)
+
+Mon · 12:00 PM PST
+
+Online
+
+Jan5
+
+### [Robotics Mixer](/events/robotics-mixer)
+
+Mon · 7:00 PM
+
+Menlo Park
+"""
+
+
+def _fields(events):
+    return [
+        (event.title, event.url, event.date, event.time, event.location)
+        for event in events
+    ]
+
+
+def test_parses_events(fixed_now):
+    events = CerebralvalleyAiPlugin()._parse_events(MARKDOWN)
+
+    assert _fields(events) == [
+        ("GenAI Demo Night", "https://cerebralvalley.ai/events/genai-demo-night",
+         datetime(2026, 1, 30), "5:00 PM – 9:00 PM PST", "Shack15, San Francisco, CA"),
+        ("Agents Hackathon", "https://partiful.com/e/agents",
+         datetime(2026, 1, 30), "6:00 PM", None),
+        ("LLM Paper Club", "https://cerebralvalley.ai/events/paper-club",
+         datetime(2026, 2, 2), "12:00 PM PST", None),
+        ("Robotics Mixer", "https://cerebralvalley.ai/events/robotics-mixer",
+         datetime(2027, 1, 5), "7:00 PM", "Menlo Park"),
+    ]
+    assert events[0].description.startswith("Join founders and researchers")
+    assert events[1].description is None
+
+
+def test_skips_navigation_links(fixed_now):
+    events = CerebralvalleyAiPlugin()._parse_events(MARKDOWN)
+
+    assert "All Events" not in [event.title for event in events]
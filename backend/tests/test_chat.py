@@ -0,0 +1,531 @@
+"""Tests for the chat service."""
+
+import asyncio
+from collections import Counter, OrderedDict
+from datetime import datetime
+
+import pytest
+
+from backend.models import Event, make_event_id
+from backend.plugins.base import ScraperPlugin
+from backend.services import chat, plugin_loader, response_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test empty conversations, caches and plugin state."""
+    monkeypatch.setattr(chat, "_conversations", OrderedDict())
+    monkeypatch.setattr(response_cache, "_response_cache", OrderedDict())
+    monkeypatch.setattr(chat, "_scrape_cache", {})
+    monkeypatch.setattr(chat, "_inflight_scrapes", {})
+    monkeypatch.setattr(chat, "_search_results", {})
+    monkeypatch.setattr(chat, "_plugin_instances", {})
+    monkeypatch.setattr(chat, "_query_counts", Counter())
+
+
+def make_event(title, day=1):
+    """Build an event on the given day of February 2026."""
+    date = datetime(2026, 2, day)
+    url = f"https://example.com/{title.lower().replace(' ', '-')}"
+    return Event(id=make_event_id("Fake", url, date), title=title, date=date, url=url, source="Fake")
+
+
+def make_plugin(plugin_name, events, cacheable=True):
+    """Build a plugin class that returns copies of events and counts scrapes."""
+
+    class FakePlugin(ScraperPlugin):
+        name = plugin_name
+        source_url = f"https://example.com/{plugin_name}"
+        description = "Test plugin"
+        scrapes = 0
+
+        async def scrape(self, query=None):
+            type(self).scrapes += 1
+            return list(events)
+
+    FakePlugin.cacheable = cacheable
+    return FakePlugin
+
+
+def use_plugins(monkeypatch, *plugin_classes):
+    """Make plugin_classes the loaded plugins."""
+    registry = {plugin_class.name: plugin_class for plugin_class in plugin_classes}
+    monkeypatch.setattr(chat, "get_plugin_registry", lambda: registry)
+
+
+def _fake_stream_chat_with_tools(calls, tool_names=("search_events", "display_events")):
+    """Build a stand-in for stream_chat_with_tools that records each call."""
+
+    async def stream_chat_with_tools(message, conversation_history=None, **kwargs):
+        calls.append(message)
+        yield "tool_use", list(tool_names)
+        yield "text", f"Answer {len(calls)}"
+        yield "events", []
+
+    return stream_chat_with_tools
+
+
+async def _send(message, conversation_id=None):
+    """Run one chat turn and return (conversation ID, response text)."""
+    conv_id = conversation_id
+    chunks = []
+    async for kind, value in chat.stream_chat_message(message, conversation_id):
+        if kind == "conversation":
+            conv_id = value
+        elif kind == "text":
+            chunks.append(value)
+        elif kind == "tool_use":
+            chunks.clear()
+    return conv_id, "".join(chunks)
+
+
+def test_repeated_message_is_answered_from_cache(monkeypatch):
+    calls = []
+    monkeypatch.setattr(chat, "stream_chat_with_tools", _fake_stream_chat_with_tools(calls))
+
+    async def run():
+        conv_id, first = await _send("find ai events in sf")
+        replies = [first]
+        for _ in range(3):
+            _, reply = await _send("find ai events in sf", conv_id)
+            replies.append(reply)
+        return conv_id, replies
+
+    conv_id, replies = asyncio.run(run())
+
+    assert calls == ["find ai events in sf"]
+    assert replies == ["Answer 1"] * 4
+    assert len(chat.get_conversation(conv_id)) == 8
+
+
+def test_turns_with_side_effects_are_not_cached(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        chat,
+        "stream_chat_with_tools",
+        _fake_stream_chat_with_tools(calls, ("schedule_event_reminder",)),
+    )
+
+    async def run():
+        conv_id, _ = await _send("remind me about the meetup")
+        await _send("remind me about the meetup", conv_id)
+
+    asyncio.run(run())
+
+    assert len(calls) == 2
+
+
+def test_different_message_calls_the_model(monkeypatch):
+    calls = []
+    monkeypatch.setattr(chat, "stream_chat_with_tools", _fake_stream_chat_with_tools(calls))
+
+    async def run():
+        conv_id, _ = await _send("find ai events in sf")
+        await _send("find music events in oakland", conv_id)
+
+    asyncio.run(run())
+
+    assert len(calls) == 2
+
+
+def _count_formatting(monkeypatch):
+    """Count calls to format_events_for_tool_response."""
+    calls = []
+    format_events = chat.format_events_for_tool_response
+
+    def counting(events):
+        calls.append(events)
+        return format_events(events)
+
+    monkeypatch.setattr(chat, "format_events_for_tool_response", counting)
+    return calls
+
+
+def test_search_merges_plugins_by_id_and_date(monkeypatch):
+    shared = make_event("Shared Meetup", day=3)
+    use_plugins(
+        monkeypatch,
+        make_plugin("A", [shared, make_event("Late Talk", day=9)]),
+        make_plugin("B", [make_event("Early Hack", day=1), shared]),
+    )
+
+    tool_result, events = asyncio.run(chat.search_events())
+
+    assert [event.title for event in events] == ["Early Hack", "Shared Meetup", "Late Talk"]
+    assert '"count":3' in tool_result
+
+
+def test_search_reuses_formatted_results_while_scrapes_are_cached(monkeypatch):
+    plugin_a = make_plugin("A", [make_event("Meetup")])
+    plugin_b = make_plugin("B", [make_event("Hackathon", day=2)])
+    use_plugins(monkeypatch, plugin_a, plugin_b)
+    formatted = _count_formatting(monkeypatch)
+
+    async def run():
+        return await chat.search_events("ai"), await chat.search_events(" AI ")
+
+    (first_result, first_events), (second_result, second_events) = asyncio.run(run())
+
+    assert len(formatted) == 1
+    assert second_result is first_result
+    assert second_events is first_events
+    assert plugin_a.scrapes == plugin_b.scrapes == 1
+
+
+def test_search_is_rebuilt_when_a_plugin_scrapes_again(monkeypatch):
+    use_plugins(monkeypatch, make_plugin("A", [make_event("Meetup")]))
+    formatted = _count_formatting(monkeypatch)
+
+    asyncio.run(chat.search_events())
+    # The scrape cache entry expired
+    chat._scrape_cache.clear()
+    asyncio.run(chat.search_events())
+
+    assert len(formatted) == 2
+
+
+def test_search_with_uncacheable_plugin_is_always_rebuilt(monkeypatch):
+    use_plugins(
+        monkeypatch,
+        make_plugin("A", [make_event("Meetup")]),
+        make_plugin("Demo", [make_event("Demo Day")], cacheable=False),
+    )
+    formatted = _count_formatting(monkeypatch)
+
+    asyncio.run(chat.search_events())
+    asyncio.run(chat.search_events())
+
+    assert len(formatted) == 2
+
+
+PLUGIN_CODE = """
+from datetime import datetime
+
+from backend.models import Event
+from backend.plugins.base import ScraperPlugin
+
+
+class ExampleComPlugin(ScraperPlugin):
+    name = "ExampleCom"
+    source_url = "https://example.com/events"
+    description = "Scrapes events from example.com"
+
+    async def scrape(self, query=None):
+        return [Event(id="meetup", title="Meetup", date=datetime(2026, 2, 1),
+                      url="https://example.com/meetup", source=self.name)]
+"""
+
+# A plugin that loads and runs but finds nothing on the page
+EMPTY_PLUGIN_CODE = """
+from backend.plugins.base import ScraperPlugin
+
+
+class ExampleComPlugin(ScraperPlugin):
+    name = "ExampleCom"
+    source_url = "https://example.com/events"
+    description = "Scrapes events from example.com"
+
+    async def scrape(self, query=None):
+        return []
+"""
+
+
+@pytest.fixture
+def plugin_dir(tmp_path, monkeypatch):
+    """Create plugins in an empty temporary plugins directory."""
+    monkeypatch.setattr(chat, "get_plugins_directory", lambda: tmp_path)
+    monkeypatch.setattr(plugin_loader, "get_plugins_directory", lambda: tmp_path)
+    monkeypatch.setattr(plugin_loader, "_plugin_registry", {})
+    monkeypatch.setattr(plugin_loader, "_plugin_file_classes", {})
+    monkeypatch.setattr(plugin_loader, "_plugin_file_stats", {})
+    monkeypatch.setattr(plugin_loader, "_plugin_info", ())
+    monkeypatch.setattr(plugin_loader, "_plugin_info_json", b"[]")
+    monkeypatch.setattr(chat, "_plugin_code_cache", {})
+    monkeypatch.setattr(chat, "_inflight_plugin_creations", {})
+    return tmp_path
+
+
+def fake_generation(monkeypatch, code, page="# Events\n\n[ ](https://example.com/meetup)"):
+    """Serve a fixed page and fixed generated code.
+
+    Returns:
+        The mutable page state, and the list of pages code was generated for.
+    """
+    state = {"page": page}
+    generated = []
+
+    async def crawl_url_for_structure(url):
+        return state["page"]
+
+    async def generate_plugin_code(url, page_markdown, domain_name=None):
+        generated.append(page_markdown)
+        return code
+
+    monkeypatch.setattr(chat, "crawl_url_for_structure", crawl_url_for_structure)
+    monkeypatch.setattr(chat, "generate_plugin_code", generate_plugin_code)
+    return state, generated
+
+
+def test_plugin_code_is_reused_for_an_unchanged_page(plugin_dir, monkeypatch):
+    _, generated = fake_generation(monkeypatch, PLUGIN_CODE)
+
+    async def run():
+        return (
+            await chat.create_plugin_for_url("https://example.com/events"),
+            await chat.create_plugin_for_url("https://example.com/events"),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert first.startswith("Successfully created plugin")
+    assert second.startswith("Successfully created plugin")
+    assert "Reused plugin code" in second
+    assert len(generated) == 1
+    assert "ExampleCom" in plugin_loader.get_plugin_registry()
+
+
+def test_plugin_code_is_regenerated_when_the_page_changes(plugin_dir, monkeypatch):
+    page, generated = fake_generation(monkeypatch, PLUGIN_CODE)
+
+    asyncio.run(chat.create_plugin_for_url("https://example.com/events"))
+    page["page"] += "\n\n[ ](https://example.com/another)"
+    asyncio.run(chat.create_plugin_for_url("https://example.com/events"))
+
+    assert len(generated) == 2
+
+
+def test_plugin_code_that_finds_no_events_is_not_reused(plugin_dir, monkeypatch):
+    _, generated = fake_generation(monkeypatch, EMPTY_PLUGIN_CODE)
+
+    asyncio.run(chat.create_plugin_for_url("https://example.com/events"))
+    asyncio.run(chat.create_plugin_for_url("https://example.com/events"))
+
+    assert len(generated) == 2
+    assert chat._plugin_code_cache == {}
+
+
+def test_reused_code_that_no_longer_loads_is_evicted(plugin_dir, monkeypatch):
+    _, generated = fake_generation(monkeypatch, PLUGIN_CODE)
+    url = "https://example.com/events"
+
+    asyncio.run(chat.create_plugin_for_url(url))
+    load_plugin_from_file = chat.load_plugin_from_file
+    monkeypatch.setattr(chat, "load_plugin_from_file", lambda file_path: [])
+    result = asyncio.run(chat.create_plugin_for_url(url))
+
+    assert "error during testing" in result
+    assert url not in chat._plugin_code_cache
+
+    monkeypatch.setattr(chat, "load_plugin_from_file", load_plugin_from_file)
+    asyncio.run(chat.create_plugin_for_url(url))
+
+    assert len(generated) == 2
+
+
+def test_concurrent_scrapes_of_a_plugin_are_shared(monkeypatch):
+    events = [make_event("Meetup")]
+
+    class SlowPlugin(make_plugin("Slow", events)):
+        async def scrape(self, query=None):
+            await asyncio.sleep(0.01)
+            return await super().scrape(query)
+
+    use_plugins(monkeypatch, SlowPlugin)
+
+    async def run():
+        semaphore = asyncio.Semaphore(1)
+        return await asyncio.gather(*(
+            chat._scrape_plugin(SlowPlugin, None, semaphore) for _ in range(3)
+        ))
+
+    results = asyncio.run(run())
+
+    assert SlowPlugin.scrapes == 1
+    assert results[0] == results[1] == results[2] == events
+    assert chat._inflight_scrapes == {}
+    assert chat._scrape_cache[("Slow", "")][1] == events
+
+
+def test_scrapes_of_a_replaced_plugin_are_not_cached(monkeypatch):
+    old_plugin = make_plugin("Example", [make_event("Old Meetup")])
+    new_plugin = make_plugin("Example", [make_event("New Meetup")])
+    use_plugins(monkeypatch, new_plugin)
+
+    asyncio.run(chat._scrape_plugin(old_plugin, None, asyncio.Semaphore(1)))
+
+    assert chat._scrape_cache == {}
+
+
+def test_creating_a_plugin_drops_its_old_results(plugin_dir, monkeypatch):
+    page, _ = fake_generation(monkeypatch, PLUGIN_CODE)
+    url = "https://example.com/events"
+    asyncio.run(chat.create_plugin_for_url(url))
+
+    stale = [make_event("Old Meetup")]
+    chat._scrape_cache[("ExampleCom", "")] = (0.0, stale)
+    chat._scrape_cache[("Other", "")] = (0.0, stale)
+    chat._inflight_scrapes[("ExampleCom", "ai")] = object()
+    page["page"] += "\n\n[ ](https://example.com/another)"
+    asyncio.run(chat.create_plugin_for_url(url))
+
+    assert list(chat._scrape_cache) == [("Other", "")]
+    assert chat._inflight_scrapes == {}
+
+
+def _scrape(plugin_class, query=None):
+    return asyncio.run(chat._scrape_plugin(plugin_class, query, asyncio.Semaphore(1)))
+
+
+def test_scrape_results_are_cached_until_they_expire(monkeypatch):
+    plugin = make_plugin("A", [make_event("Meetup")])
+    use_plugins(monkeypatch, plugin)
+
+    first = _scrape(plugin)
+    second = _scrape(plugin)
+    assert second is first
+    assert plugin.scrapes == 1
+
+    timestamp, events = chat._scrape_cache[("A", "")]
+    chat._scrape_cache[("A", "")] = (timestamp - chat.SCRAPE_CACHE_TTL, events)
+    _scrape(plugin)
+    assert plugin.scrapes == 2
+
+
+def test_plugins_without_search_share_one_cache_entry(monkeypatch):
+    plugin = make_plugin("A", [make_event("Meetup")])
+    use_plugins(monkeypatch, plugin)
+
+    _scrape(plugin, "ai")
+    _scrape(plugin, "music")
+
+    assert plugin.scrapes == 1
+    assert list(chat._scrape_cache) == [("A", "")]
+
+
+def test_empty_and_uncacheable_results_are_not_cached(monkeypatch):
+    empty = make_plugin("Empty", [])
+    demo = make_plugin("Demo", [make_event("Demo Day")], cacheable=False)
+    use_plugins(monkeypatch, empty, demo)
+
+    for _ in range(2):
+        _scrape(empty)
+        _scrape(demo)
+
+    assert empty.scrapes == demo.scrapes == 2
+    assert chat._scrape_cache == {}
+
+
+def test_slow_and_failing_plugins_do_not_hold_up_the_others(monkeypatch):
+    fast = make_plugin("Fast", [make_event("Meetup")])
+
+    class SlowPlugin(make_plugin("Slow", [make_event("Late Talk")])):
+        async def scrape(self, query=None):
+            await asyncio.sleep(0.2)
+            return await super().scrape(query)
+
+    class BrokenPlugin(make_plugin("Broken", [])):
+        async def scrape(self, query=None):
+            raise RuntimeError("boom")
+
+    use_plugins(monkeypatch, SlowPlugin, BrokenPlugin, fast)
+    monkeypatch.setattr(chat, "PLUGIN_SCRAPE_TIMEOUT", 0.05)
+
+    async def run():
+        results = [item async for item in chat.iter_plugin_events()]
+        # The timed-out scrape keeps running and fills the cache for later
+        await asyncio.sleep(0.3)
+        return results
+
+    results = dict(asyncio.run(run()))
+
+    assert [event.title for event in results["Fast"]] == ["Meetup"]
+    assert results["Slow"] == []
+    assert results["Broken"] == []
+    assert [event.title for event in chat._scrape_cache[("Slow", "")][1]] == ["Late Talk"]
+
+
+def test_conversations_are_reused_until_they_expire():
+    conv_id, messages = chat.get_or_create_conversation(None)
+
+    assert chat.get_or_create_conversation(conv_id) == (conv_id, messages)
+
+    last_used, _ = chat._conversations[conv_id]
+    chat._conversations[conv_id] = (last_used - chat.CONVERSATION_TTL, messages)
+    new_id, new_messages = chat.get_or_create_conversation(conv_id)
+
+    assert new_id != conv_id
+    assert new_messages == []
+
+
+def test_least_recently_used_conversations_are_dropped(monkeypatch):
+    monkeypatch.setattr(chat, "MAX_CONVERSATIONS", 2)
+    first, _ = chat.get_or_create_conversation(None)
+    second, _ = chat.get_or_create_conversation(None)
+    response_cache.cache_response(second, "find ai events in sf", {"response": "Sure"})
+
+    # Using the first conversation makes the second the oldest
+    chat.get_or_create_conversation(first)
+    third, _ = chat.get_or_create_conversation(None)
+
+    assert list(chat._conversations) == [first, third]
+    assert second not in response_cache._response_cache
+
+
+def test_stored_history_is_capped():
+    _, messages = chat.get_or_create_conversation(None)
+
+    for turn in range(chat.MAX_STORED_MESSAGES):
+        chat._remember_turn(messages, f"question {turn}", f"answer {turn}")
+
+    assert len(messages) == chat.MAX_STORED_MESSAGES
+    assert messages[-1] == {"role": "assistant", "content": f"answer {chat.MAX_STORED_MESSAGES - 1}"}
+    assert messages[0]["role"] == "user"
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [
+        "```python\nprint('hi')\n```",
+        "```py\nprint('hi')\n```",
+        "```\nprint('hi')\n```",
+        # Cut off before the closing fence
+        "```python\nprint('hi')",
+        "  \nprint('hi')\n  ",
+    ],
+)
+def test_generated_code_is_unfenced(monkeypatch, reply):
+    async def send_message(message, system_prompt=None):
+        return reply
+
+    monkeypatch.setattr(chat, "send_message", send_message)
+
+    code = asyncio.run(chat.generate_plugin_code("https://example.com/events", "# Events"))
+
+    assert code == "print('hi')"
+
+
+def test_code_fences_inside_the_code_are_kept(monkeypatch):
+    reply = '```python\nDOC = """\n```\nexample\n```\n"""\n```'
+
+    async def send_message(message, system_prompt=None):
+        return reply
+
+    monkeypatch.setattr(chat, "send_message", send_message)
+
+    code = asyncio.run(chat.generate_plugin_code("https://example.com/events", "# Events"))
+
+    assert code == 'DOC = """\n```\nexample\n```\n"""'
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://lu.ma/sf", "lu_ma"),
+        ("https://www.eventbrite.com/d/ca--san-francisco/events/", "eventbrite_com"),
+        ("http://Meetup.COM", "meetup_com"),
+        ("partiful.com/e/abc", "partiful_com"),
+        ("https://sub.my-site.co.uk:8080/x", "sub_my_site_co_uk8080"),
+    ],
+)
+def test_extract_domain_name(url, expected):
+    assert chat.extract_domain_name(url) == expected
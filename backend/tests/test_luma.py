@@ -0,0 +1,127 @@
+"""Parser regression tests for the Luma plugin."""
+
+from datetime import datetime
+
+from backend.plugins.luma import LumaPlugin
+
+MARKDOWN = """# Discover Events in San Francisco
+
+[Sign in](https://luma.com/signin)
+
+Today
+Thursday
+
+[ ](https://luma.com/abc123)
+
+5:00 PM
+
+### AI Builders Meetup
+
+By Jane Doe
+
+SF AI Hub, San Francisco
+
++12
+
+[ ](https://luma.com/def456)[ ](https://luma.com/def456)
+
+6:30 PM PST
+
+### Founders & Funders Night
+
+Waitlist
+
+The Pad, Palo Alto
+
+Jan 30
+Friday
+
+[ ](https://luma.com/ghi789)
+
+10:00 AM
+
+### Weekend Hackathon
+
+Going
+
+Moscone Center, San Francisco
+
+Jan 5
+Monday
+
+[ ](https://luma.com/jkl012)
+
+7:00 PM
+
+### New Year Demo Day
+
+Shack15, San Francisco
+"""
+
+
+def _fields(events):
+    return [
+        (event.title, event.url, event.date, event.time, event.location)
+        for event in events
+    ]
+
+
+def test_parses_events(fixed_now):
+    events = LumaPlugin()._parse_events(MARKDOWN)
+
+    assert _fields(events) == [
+        ("AI Builders Meetup", "https://luma.com/abc123", datetime(2026, 1, 29),
+         "5:00 PM", "SF AI Hub, San Francisco"),
+        ("Founders & Funders Night", "https://luma.com/def456", datetime(2026, 1, 29),
+         "6:30 PM PST", "The Pad, Palo Alto"),
+        ("Weekend Hackathon", "https://luma.com/ghi789", datetime(2026, 1, 30),
+         "10:00 AM", "Moscone Center, San Francisco"),
+        ("New Year Demo Day", "https://luma.com/jkl012", datetime(2027, 1, 5),
+         "7:00 PM", "Shack15, San Francisco"),
+    ]
+    assert all(event.source == "Luma" for event in events)
+
+
+def test_ignores_pages_without_events(fixed_now):
+    assert LumaPlugin()._parse_events("# Nothing here\n\n[Sign in](https://luma.com/signin)\n") == []
+
+
+def test_section_headers_date_the_events_below_them(fixed_now):
+    markdown = "\n\n".join([
+        "Tomorrow",
+        "[ ](https://luma.com/aaa111)",
+        "### Morning Run",
+        # Not a real date, so the previous section continues
+        "Feb 30",
+        "[ ](https://luma.com/bbb222)",
+        "### Lunch Talk",
+        "  Mar 3  ",
+        "[ ](https://luma.com/ccc333)",
+        "### Evening Mixer",
+    ])
+
+    events = LumaPlugin()._parse_events(markdown)
+
+    assert [(event.title, event.date) for event in events] == [
+        ("Morning Run", datetime(2026, 1, 30)),
+        ("Lunch Talk", datetime(2026, 1, 30)),
+        ("Evening Mixer", datetime(2026, 3, 3)),
+    ]
+
+
+def test_create_event_parses_date_strings(fixed_now):
+    plugin = LumaPlugin()
+
+    assert plugin._create_event("A", "u", "Feb 3").date == datetime(2026, 2, 3)
+    assert plugin._create_event("A", "u", "January 5").date == datetime(2027, 1, 5)
+    assert plugin._create_event("A", "u", "Mar 1, 2028").date == datetime(2028, 3, 1)
+    # Unparseable dates fall back to the time of the scrape
+    assert plugin._create_event("A", "u", "someday").date == fixed_now
+
+
+def test_event_ids_are_stable_across_scrapes(fixed_now):
+    first = LumaPlugin()._parse_events(MARKDOWN)
+    second = LumaPlugin()._parse_events(MARKDOWN)
+
+    assert [event.id for event in first] == [event.id for event in second]
+    assert len({event.id for event in first}) == len(first)
@@ -0,0 +1,53 @@
+"""Tests for the event models."""
+
+from datetime import datetime
+
+from backend.models import Event, EventResponse, make_event_id
+
+
+def test_make_event_id_is_deterministic():
+    first = make_event_id("Luma", "https://luma.com/abc123", datetime(2026, 1, 29))
+    second = make_event_id("Luma", "https://luma.com/abc123", datetime(2026, 1, 29))
+
+    assert first == second
+    assert len(first) == 16
+
+
+def test_make_event_id_differs_by_source_url_and_date():
+    base = make_event_id("Luma", "https://luma.com/abc123", datetime(2026, 1, 29))
+
+    assert make_event_id("Meetup", "https://luma.com/abc123", datetime(2026, 1, 29)) != base
+    assert make_event_id("Luma", "https://luma.com/def456", datetime(2026, 1, 29)) != base
+    assert make_event_id("Luma", "https://luma.com/abc123", datetime(2026, 1, 30)) != base
+
+
+def _event(**overrides):
+    fields = {
+        "id": make_event_id("Luma", "https://luma.com/abc123", datetime(2026, 1, 29)),
+        "title": "AI Builders Meetup",
+        "date": datetime(2026, 1, 29, 17, 0),
+        "time": "5:00 PM",
+        "location": "SF AI Hub, San Francisco",
+        "url": "https://luma.com/abc123",
+        "source": "Luma",
+        "tags": ["ai"],
+    }
+    fields.update(overrides)
+    return Event(**fields)
+
+
+def test_response_data_matches_event_response():
+    event = _event()
+
+    validated = EventResponse.model_validate(event.response_data)
+
+    assert validated.model_dump() == event.response_data
+    assert event.response_data["date"] == "2026-01-29T17:00:00"
+    # Built once per event and reused by every response
+    assert event.response_data is event.response_data
+
+
+def test_response_data_with_optional_fields_missing():
+    event = _event(description=None, time=None, location=None, tags=[])
+
+    assert EventResponse.model_validate(event.response_data).model_dump() == event.response_data
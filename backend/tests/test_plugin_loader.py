@@ -0,0 +1,104 @@
+"""Tests for plugin discovery and the plugin registry."""
+
+import json
+import os
+
+import pytest
+
+from backend.services import plugin_loader
+
+PLUGIN_CODE = '''
+from backend.plugins.base import ScraperPlugin
+from backend.plugins.luma import LumaPlugin
+
+
+class {name}Plugin(ScraperPlugin):
+    name = "{name}"
+    source_url = "https://example.com/{name}"
+    description = "{description}"
+
+    async def scrape(self, query=None):
+        return []
+'''
+
+
+@pytest.fixture
+def plugin_dir(tmp_path, monkeypatch):
+    """Load plugins from an empty temporary plugins directory."""
+    monkeypatch.setattr(plugin_loader, "get_plugins_directory", lambda: tmp_path)
+    monkeypatch.setattr(plugin_loader, "_plugin_registry", {})
+    monkeypatch.setattr(plugin_loader, "_plugin_file_classes", {})
+    monkeypatch.setattr(plugin_loader, "_plugin_file_stats", {})
+    monkeypatch.setattr(plugin_loader, "_plugin_info", ())
+    monkeypatch.setattr(plugin_loader, "_plugin_info_json", b"[]")
+    return tmp_path
+
+
+def write_plugin(directory, name, description="Test plugin", filename=None):
+    path = directory / (filename or f"{name.lower()}.py")
+    path.write_text(PLUGIN_CODE.format(name=name, description=description))
+    return path
+
+
+def test_scan_skips_non_plugin_files(plugin_dir):
+    write_plugin(plugin_dir, "Alpha")
+    (plugin_dir / "__init__.py").write_text("")
+    (plugin_dir / "base.py").write_text("")
+    (plugin_dir / "beta.py.tmp").write_text("")
+    (plugin_dir / "notes.txt").write_text("")
+
+    assert [path.name for path in plugin_loader.scan_plugin_files()] == ["alpha.py"]
+
+
+def test_only_classes_defined_in_the_file_are_loaded(plugin_dir):
+    registry = plugin_loader.load_all_plugins()
+
+    assert registry == {}
+
+    write_plugin(plugin_dir, "Alpha")
+    registry = plugin_loader.load_all_plugins()
+
+    # LumaPlugin is imported by the file but defined elsewhere
+    assert list(registry) == ["Alpha"]
+
+
+def test_unchanged_files_are_not_reimported(plugin_dir):
+    path = write_plugin(plugin_dir, "Alpha")
+    first = plugin_loader.load_all_plugins()["Alpha"]
+
+    assert plugin_loader.reload_plugins()["Alpha"] is first
+
+    write_plugin(plugin_dir, "Alpha", description="Changed description")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    changed = plugin_loader.reload_plugins()["Alpha"]
+
+    assert changed is not first
+    assert changed.description == "Changed description"
+
+
+def test_removed_files_are_forgotten(plugin_dir):
+    path = write_plugin(plugin_dir, "Alpha")
+    write_plugin(plugin_dir, "Beta")
+    plugin_loader.load_all_plugins()
+
+    path.unlink()
+    registry = plugin_loader.reload_plugins()
+
+    assert list(registry) == ["Beta"]
+    assert path not in plugin_loader._plugin_file_classes
+
+
+def test_reload_publishes_a_new_registry(plugin_dir):
+    write_plugin(plugin_dir, "Alpha")
+    old_registry = plugin_loader.load_all_plugins()
+
+    write_plugin(plugin_dir, "Beta")
+    new_registry = plugin_loader.reload_plugins()
+
+    # Readers holding the old registry never see it change
+    assert list(old_registry) == ["Alpha"]
+    assert sorted(new_registry) == ["Alpha", "Beta"]
+    assert plugin_loader.get_plugin_registry() is new_registry
+    assert sorted(info["name"] for info in plugin_loader.get_plugin_info()) == ["Alpha", "Beta"]
+    assert json.loads(plugin_loader.get_plugin_info_json()) == list(plugin_loader.get_plugin_info())
@@ -0,0 +1,78 @@
+"""Tests for the chat response cache."""
+
+import pytest
+
+from backend.services import response_cache
+from backend.services.response_cache import (
+    cache_response,
+    clear_cached_responses,
+    get_cached_response,
+)
+
+RESPONSE = {"response": "Here are some AI events", "conversation_id": "c1", "events": []}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    response_cache._response_cache.clear()
+    yield
+    response_cache._response_cache.clear()
+
+
+def test_hit_for_same_message_and_context():
+    cache_response("c1", "find ai events in sf", RESPONSE, "previous reply")
+
+    assert get_cached_response("c1", "Find AI events in SF!", "previous reply") == RESPONSE
+
+
+def test_miss_for_different_message():
+    cache_response("c1", "find ai events in sf", RESPONSE)
+
+    assert get_cached_response("c1", "find music events in oakland") is None
+
+
+def test_miss_for_different_context():
+    cache_response("c1", "find ai events in sf", RESPONSE, "previous reply")
+
+    assert get_cached_response("c1", "find ai events in sf", "another reply") is None
+
+
+def test_miss_for_reordered_words():
+    cache_response("c1", "events in sf this week", RESPONSE)
+
+    assert get_cached_response("c1", "this week events in sf") is None
+
+
+def test_miss_for_other_conversation():
+    cache_response("c1", "find ai events in sf", RESPONSE)
+
+    assert get_cached_response("c2", "find ai events in sf") is None
+
+
+def test_short_messages_are_not_cached():
+    cache_response("c1", "yes", RESPONSE)
+
+    assert get_cached_response("c1", "yes") is None
+    assert "c1" not in response_cache._response_cache
+
+
+def test_expired_entries_miss(monkeypatch):
+    cache_response("c1", "find ai events in sf", RESPONSE)
+    later = response_cache.time.monotonic() + response_cache.RESPONSE_CACHE_TTL + 1
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: later)
+
+    assert get_cached_response("c1", "find ai events in sf") is None
+
+
+def test_clear_cached_responses():
+    cache_response("c1", "find ai events in sf", RESPONSE)
+    clear_cached_responses("c1")
+
+    assert get_cached_response("c1", "find ai events in sf") is None
+
+
+def test_hit_when_repeating_the_message_just_answered():
+    cache_response("c1", "find ai events in sf", RESPONSE, "previous reply")
+
+    # The repeat follows the cached reply, not the reply before the question
+    assert get_cached_response("c1", "find ai events in sf", RESPONSE["response"]) == RESPONSE